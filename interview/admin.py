@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Resume, Question, InterviewSession, Profile
+from .models import Resume, Question, InterviewSession, InterviewAnswer, Profile, ResumeJob
 
 admin.site.site_title = "Nexora Admin Portal"
 admin.site.site_header = "Nexora Admin Portal"
@@ -19,6 +19,7 @@ class QuestionAdmin(admin.ModelAdmin):
     list_display = ('get_short_question', 'level', 'get_keywords')
     search_fields = ('question_text', 'level')
     list_filter = ('level',)
+    readonly_fields = ('normalized_keywords', 'keyword_terms', 'keyword_tokens')
     
     def get_short_question(self, obj):
         if not obj.question_text:
@@ -41,9 +42,25 @@ class InterviewSessionAdmin(admin.ModelAdmin):
     readonly_fields = ('session_id', 'created_at')
 
 
+@admin.register(InterviewAnswer)
+class InterviewAnswerAdmin(admin.ModelAdmin):
+    list_display = ('interview_id', 'username', 'position', 'question_id', 'score', 'flag', 'created_at')
+    search_fields = ('interview_id', 'username')
+    list_filter = ('created_at',)
+    readonly_fields = ('interview_id', 'created_at')
+
+
 @admin.register(Profile)
 class ProfileAdmin(admin.ModelAdmin):
     list_display = ('name', 'user', 'email', 'unique_user_id', 'created_at')
     search_fields = ('name', 'email', 'unique_user_id')
     list_filter = ('created_at',)
-    readonly_fields = ('unique_user_id', 'created_at')
\ No newline at end of file
+    readonly_fields = ('unique_user_id', 'created_at')
+
+
+@admin.register(ResumeJob)
+class ResumeJobAdmin(admin.ModelAdmin):
+    list_display = ('job_id', 'username', 'status', 'error_code', 'created_at', 'updated_at')
+    search_fields = ('job_id', 'username')
+    list_filter = ('status', 'error_code', 'created_at')
+    readonly_fields = ('job_id', 'created_at', 'updated_at')
@@ -0,0 +1,113 @@
+# interview/admission.py
+# Admission control for CPU-heavy work (resume parsing).
+#
+# A per-process limiter: at most `max_in_flight` jobs are admitted at once,
+# at most `max_queue` requests may wait for a slot, and a waiter gives up
+# after `queue_timeout` seconds. Anything beyond that is rejected so the
+# caller can answer 503 + Retry-After instead of piling more work onto a
+# saturated worker.
+
+import threading
+
+from django.conf import settings
+
+
+class AdmissionRejected(Exception):
+    """Raised when the limiter is over capacity."""
+
+    def __init__(self, retry_after):
+        super().__init__(f"Over capacity, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class AdmissionTicket:
+    """A held slot. release() is idempotent, so it is safe to call from any path."""
+
+    def __init__(self, controller):
+        self._controller = controller
+        self._released = False
+        self._lock = threading.Lock()
+
+    def release(self):
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._controller._release()
+
+
+class AdmissionController:
+
+    def __init__(self, max_in_flight, max_queue, queue_timeout, retry_after):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+        self._cond = threading.Condition()
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.completed = 0
+
+    def acquire(self):
+        """Take a slot, waiting in the bounded queue if needed; raise AdmissionRejected if full."""
+        with self._cond:
+            if self.in_flight >= self.max_in_flight:
+                if self.queued >= self.max_queue:
+                    self.rejected += 1
+                    raise AdmissionRejected(self.retry_after)
+
+                self.queued += 1
+                try:
+                    got_slot = self._cond.wait_for(
+                        lambda: self.in_flight < self.max_in_flight,
+                        timeout=self.queue_timeout,
+                    )
+                finally:
+                    self.queued -= 1
+                if not got_slot:
+                    self.rejected += 1
+                    raise AdmissionRejected(self.retry_after)
+
+            self.in_flight += 1
+            self.admitted += 1
+        return AdmissionTicket(self)
+
+    def _release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self.completed += 1
+            self._cond.notify()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "in_flight": self.in_flight,
+                "queued": self.queued,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "completed": self.completed,
+                "max_in_flight": self.max_in_flight,
+                "max_queue": self.max_queue,
+            }
+
+
+_resume_admission = None
+_resume_admission_lock = threading.Lock()
+
+
+def get_resume_admission():
+    """Process-wide limiter for resume parsing, configured from settings."""
+    global _resume_admission
+    if _resume_admission is None:
+        with _resume_admission_lock:
+            if _resume_admission is None:
+                _resume_admission = AdmissionController(
+                    max_in_flight=getattr(settings, 'RESUME_PARSE_MAX_IN_FLIGHT', 4),
+                    max_queue=getattr(settings, 'RESUME_PARSE_MAX_QUEUE', 8),
+                    queue_timeout=getattr(settings, 'RESUME_PARSE_QUEUE_TIMEOUT', 2.0),
+                    retry_after=getattr(settings, 'RESUME_PARSE_RETRY_AFTER', 30),
+                )
+    return _resume_admission
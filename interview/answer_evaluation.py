@@ -2,35 +2,71 @@
 
 import re
 import string
-from typing import Dict, List, Tuple
+from functools import partial
+from typing import Dict, FrozenSet, List, Tuple, Union
 from datetime import datetime
 
 
+STOPWORDS = frozenset({
+    "a", "an", "the", "is", "and", "or", "of", "in", "to", "for", "on",
+    "with", "as", "by", "at", "it", "that", "this", "are", "was", "be",
+    "from", "if", "you", "your", "can", "will", "what", "how", "why",
+    "i", "we", "they", "he", "she"
+})
+
+
+class AnswerScorer:
+    """
+    Keyword-overlap scoring of answers.
+
+    The punctuation and word patterns and the stopwords are built once. A
+    question's keyword tokens are computed once too (keyword_tokens(), stored
+    on Question.keyword_tokens) so scoring an answer is one pass over its
+    tokens against that set.
+    """
+
+    def __init__(self, stopwords=STOPWORDS):
+        self.stopwords = frozenset(stopwords)
+        # Deleting punctuation then taking \w runs gives the same tokens as
+        # str.translate + re.split(r'\W+'), at about twice the speed
+        self.strip_punctuation = partial(re.compile('[%s]+' % re.escape(string.punctuation)).sub, '')
+        self._words = re.compile(r'\w+').findall
+
+    def tokens(self, text: str) -> List[str]:
+        """Lowercase tokens without stopwords or punctuation."""
+        if not text:
+            return []
+        stopwords = self.stopwords
+        return [t for t in self._words(self.strip_punctuation(text.lower())) if t not in stopwords]
+
+    def keyword_tokens(self, keywords: List[str]) -> FrozenSet[str]:
+        """The token set an answer is scored against for these keywords."""
+        if not keywords:
+            return frozenset()
+        return frozenset(self.tokens(" ".join(keywords)))
+
+    def score(self, answer: str, keyword_tokens: FrozenSet[str]) -> float:
+        """Fraction of `keyword_tokens` that appear in `answer`."""
+        if not keyword_tokens or not answer:
+            return 0.0
+        # Stopwords are never keyword tokens, so the intersection drops them
+        matched = keyword_tokens.intersection(self._words(self.strip_punctuation(answer.lower())))
+        return len(matched) / len(keyword_tokens)
+
+
+answer_scorer = AnswerScorer()
+
+
 def tokenize(text: str) -> List[str]:
     """Convert text to lowercase tokens without stopwords or punctuation."""
-    if not text:
-        return []
-    text = text.lower().translate(str.maketrans('', '', string.punctuation))
-    tokens = re.split(r'\W+', text)
-    stopwords = {
-        "a", "an", "the", "is", "and", "or", "of", "in", "to", "for", "on",
-        "with", "as", "by", "at", "it", "that", "this", "are", "was", "be",
-        "from", "if", "you", "your", "can", "will", "what", "how", "why",
-        "i", "we", "they", "he", "she"
-    }
-    return [t for t in tokens if t and t not in stopwords]
+    return answer_scorer.tokens(text)
 
 
 def keyword_match_score(user_ans: str, correct_keywords: List[str]) -> float:
     """Find how many correct keywords appear in the user answer."""
     if not correct_keywords or not user_ans:
         return 0.0
-    user_tokens = set(tokenize(user_ans))
-    correct_tokens = set(tokenize(" ".join(correct_keywords)))
-    if not correct_tokens:
-        return 0.0
-    matched = sum(1 for t in correct_tokens if t in user_tokens)
-    return matched / len(correct_tokens)
+    return answer_scorer.score(user_ans, answer_scorer.keyword_tokens(correct_keywords))
 
 
 def flag_for_score(score: float,
@@ -46,17 +82,33 @@ def flag_for_score(score: float,
 
 
 def evaluate_user_level(user_answers: Dict[str, str],
-                        level_bank: Dict[str, List[str]],
+                        level_bank: Dict[str, Union[List[str], FrozenSet[str]]],
                         threshold_same: float = 0.5,
                         threshold_higher: float = 0.8) -> Tuple[Dict, float, str]:
-    """Evaluate all answers for one level (e.g., beginner)."""
+    """
+    Evaluate all answers for one level (e.g., beginner).
+
+    `level_bank` maps question ids to keyword lists, or to the precomputed
+    frozensets from AnswerScorer.keyword_tokens().
+    """
+    scores = {}
+    for qid, keywords in level_bank.items():
+        ans = user_answers.get(qid, "")
+        if not isinstance(keywords, frozenset):
+            keywords = answer_scorer.keyword_tokens(keywords)
+        scores[qid] = answer_scorer.score(ans, keywords)
+    return summarize_scores(scores, threshold_same, threshold_higher)
+
+
+def summarize_scores(scores: Dict[str, float],
+                     threshold_same: float = 0.5,
+                     threshold_higher: float = 0.8) -> Tuple[Dict, float, str]:
+    """Per-question flags, average and overall flag for already computed scores."""
     per_question = {}
     total_score = 0.0
     count = 0
 
-    for qid, keywords in level_bank.items():
-        ans = user_answers.get(qid, "")
-        score = keyword_match_score(ans, keywords)
+    for qid, score in scores.items():
         flag = flag_for_score(score, threshold_same, threshold_higher)
         per_question[qid] = {"score": round(score, 2), "flag": flag}
         total_score += score
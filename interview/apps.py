@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class InterviewConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'interview'
+
+    def ready(self):
+        from . import signals  # noqa: F401  (connects question cache signals)
+
+        if getattr(settings, 'INTERVIEW_PRELOAD', False):
+            from .warmup import preload
+            preload()
@@ -0,0 +1,112 @@
+# interview/batch_scoring.py
+# Batch keyword scoring of many answers at once, for offline jobs
+# (re-scoring history, calibrating flag thresholds, grading imported answers).
+#
+# A batch of answers is normalized in one pass over the joined text (lower,
+# strip punctuation), split back into answers, and each answer's token list
+# is intersected with its question's keyword token set; counts, totals and
+# scores are numpy arrays. Numbers are identical to
+# answer_evaluation.keyword_match_score.
+#
+# ASCII answers (the common case) are processed as bytes: one translate
+# deletes punctuation and blanks every other non-word byte, and split()
+# yields the tokens, which matches the scorer's regexes for ASCII text at a
+# fraction of the cost. Other answers go through the scorer's own patterns.
+# The per-answer work runs through map(), so no Python code executes per
+# token or per answer.
+
+import re
+import string
+
+import numpy as np
+
+from .answer_evaluation import answer_scorer
+
+_SEPARATOR = "\x00"   # \W and not punctuation, so it survives normalization
+_WORDS = re.compile(r"\w+").findall
+
+# For ASCII text \w is [A-Za-z0-9_], and "_" is punctuation
+_ASCII_KEEP = set(string.ascii_letters + string.digits + _SEPARATOR)
+_ASCII_WORDS = bytes(b if chr(b) in _ASCII_KEEP else ord(" ") for b in range(256))
+_ASCII_PUNCTUATION = string.punctuation.encode("ascii")
+
+
+class BatchScorer:
+    """
+    Scores (answer, question id) pairs in bulk against fixed keyword token sets.
+
+    Built once from question id -> keyword tokens (frozensets, as on the
+    question store's records); unknown question ids raise KeyError.
+    """
+
+    def __init__(self, keyword_tokens, scorer=answer_scorer):
+        self._scorer = scorer
+        self._tokens = {}
+        self._ascii_tokens = {}
+        for question_id, tokens in keyword_tokens.items():
+            tokens = frozenset(tokens)
+            self._tokens[question_id] = tokens
+            # Non-ASCII tokens can never occur in an ASCII answer
+            self._ascii_tokens[question_id] = frozenset(t.encode("ascii") for t in tokens if t.isascii())
+
+    @classmethod
+    def from_records(cls, records):
+        """A scorer over question records (dicts with "id" and "keyword_tokens")."""
+        return cls({record["id"]: record["keyword_tokens"] for record in records})
+
+    def _split(self, answers, ascii_only):
+        """Each answer's token list, normalized in one pass over the joined text."""
+        text = _SEPARATOR.join(answers)
+        if text.count(_SEPARATOR) != len(answers) - 1:
+            text = _SEPARATOR.join(answer.replace(_SEPARATOR, " ") for answer in answers)
+
+        if ascii_only:
+            data = text.encode("ascii").lower().translate(_ASCII_WORDS, _ASCII_PUNCTUATION)
+            return map(bytes.split, data.split(_SEPARATOR.encode("ascii")))
+        return map(_WORDS, self._scorer.strip_punctuation(text.lower()).split(_SEPARATOR))
+
+    def _matched(self, answers, question_ids, ascii_only):
+        """Number of distinct keyword tokens of its question found in each answer."""
+        lookup = self._ascii_tokens if ascii_only else self._tokens
+        token_sets = map(lookup.__getitem__, question_ids)
+        found = map(frozenset.intersection, token_sets, self._split(answers, ascii_only))
+        return np.fromiter(map(len, found), dtype=np.float64, count=len(answers))
+
+    def score(self, answers, question_ids):
+        """Scores (float64 array) of answers[i] against question question_ids[i]."""
+        if len(answers) != len(question_ids):
+            raise ValueError("answers and question_ids must have the same length")
+        if not len(answers):
+            return np.zeros(0, dtype=np.float64)
+
+        answers = [answer or "" for answer in answers]
+        question_ids = list(question_ids)
+        totals = np.fromiter(
+            map(len, map(self._tokens.__getitem__, question_ids)), dtype=np.float64, count=len(question_ids)
+        )
+
+        is_ascii = np.fromiter(map(str.isascii, answers), dtype=bool, count=len(answers))
+        if is_ascii.all():
+            matched = self._matched(answers, question_ids, ascii_only=True)
+        else:
+            matched = np.zeros(len(answers), dtype=np.float64)
+            for subset, ascii_only in ((np.flatnonzero(is_ascii), True), (np.flatnonzero(~is_ascii), False)):
+                if len(subset):
+                    matched[subset] = self._matched(
+                        [answers[i] for i in subset], [question_ids[i] for i in subset], ascii_only
+                    )
+
+        return np.divide(matched, totals, out=np.zeros(len(answers), dtype=np.float64), where=totals > 0)
+
+
+def score_answers(answers, question_ids, records=None):
+    """
+    Batch keyword_match_score: answers[i] scored against question_ids[i].
+
+    Uses the question store's records unless `records` are given; build a
+    BatchScorer directly to reuse it across batches.
+    """
+    if records is None:
+        from .question_store import question_store
+        records = question_store.all()
+    return BatchScorer.from_records(records).score(answers, question_ids)
@@ -1,6 +1,10 @@
 # interview/db_operations.py
 
-from .models import Resume, Question, InterviewSession, Profile
+from .models import Resume, Question, InterviewSession, InterviewAnswer, Profile
+from .mongo_conn import get_collection
+from .question_index import mongo_filter
+from .question_store import question_store, stored_keyword_tokens
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.utils.crypto import get_random_string
 import logging
@@ -43,33 +47,82 @@ def insert_resume(resume_data):
     }
 
 
+# Insert a Resume from parser output
+def insert_parsed_resume(username, email, parsed):
+    contact_info = parsed.get("contact_info") or {}
+    return insert_resume({
+        "username": username,
+        "email": email,
+        "phone": contact_info.get("phone") or "",
+        "skills": parsed["skills"],
+        "skill_categories": parsed.get("skill_categories", {}),
+        "experience": parsed["text"][:1000],  # First 1000 chars
+        "education": "",  # TODO: Extract from resume
+    })
+
+
+# Fields a question record needs; nothing else is sent over the wire
+QUESTION_PROJECTION = {
+    "_id": 0, "id": 1, "keywords": 1, "keyword_tokens": 1, "question_text": 1, "level": 1, "answer": 1,
+}
+
+
 # Fetch Questions Based on Skills
-def get_questions_by_skills(skills, limit=10):
+def get_questions_by_skills(skills, limit=10, level=None):
+    """
+    Questions whose keywords match any skill (optionally at one level).
+
+    QUESTION_LOOKUP_BACKEND picks the in-process keyword index ("memory"),
+    which returns the most relevant questions first, or an indexed query
+    against MongoDB ("mongo"), which returns them in bank order.
+    """
     if not skills:
-        skills = []
-    
-    lower_skills = [s.lower() for s in skills]
-    matched_questions = []
-
-    for q in Question.objects.all():
-        # Handle None keywords
-        if not q.keywords:
-            continue
-            
-        question_keywords = [k.lower() for k in q.keywords if k]
-        
-        # Match skills with keywords
-        if any(skill in k or k in skill for k in question_keywords for skill in lower_skills):
-            matched_questions.append({
-                "keywords": q.keywords,
-                "question_text": q.question_text,
-                "level": q.level,
-                "answer": q.answer,
-            })
-            if len(matched_questions) >= limit:
-                break
-
-    return matched_questions
+        return []
+    if getattr(settings, 'QUESTION_LOOKUP_BACKEND', 'memory') == 'mongo':
+        return find_questions_in_mongo(skills, limit, level)
+    return question_store.search(skills, limit, level=level)
+
+
+def find_questions_in_mongo(skills, limit=10, level=None):
+    """Server-side skill lookup on the keyword_terms / normalized_keywords indexes."""
+    query = mongo_filter(skills)
+    if query is None:
+        return []
+    if level:
+        query = {"level": level, **query}
+
+    cursor = get_collection(Question).find(query, QUESTION_PROJECTION).sort("id", 1).limit(limit)
+    return [question_from_document(doc) for doc in cursor]
+
+
+def get_questions_by_ids(question_ids):
+    """
+    Records for `question_ids`, in the given order, skipping unknown ids.
+
+    Read from the backend QUESTION_LOOKUP_BACKEND names, so "mongo"
+    deployments fetch only these questions instead of loading the bank.
+    """
+    question_ids = list(question_ids)
+    if not question_ids:
+        return []
+    if getattr(settings, 'QUESTION_LOOKUP_BACKEND', 'memory') == 'mongo':
+        cursor = get_collection(Question).find({"id": {"$in": question_ids}}, QUESTION_PROJECTION)
+        found = {doc.get("id"): doc for doc in cursor}
+        return [question_from_document(found[qid]) for qid in question_ids if qid in found]
+    return question_store.get_many(question_ids)
+
+
+def question_from_document(doc):
+    """A raw (projected) Question document as the record dict question_to_dict returns."""
+    keywords = doc.get("keywords") or []
+    return {
+        "id": doc.get("id"),
+        "keywords": keywords,
+        "keyword_tokens": stored_keyword_tokens(doc.get("keyword_tokens"), keywords),
+        "question_text": doc.get("question_text"),
+        "level": doc.get("level"),
+        "answer": doc.get("answer"),
+    }
 
 
 # Save Interview Answers
@@ -86,6 +139,29 @@ def save_answers(username, skills, answers, score):
     return session_id
 
 
+# Record One Interview Answer (append-only; a resubmission adds a newer row)
+def record_interview_answer(interview_id, username, position, question_id, answer, score=0.0, flag=''):
+    InterviewAnswer.objects.create(
+        interview_id=interview_id,
+        username=username,
+        position=position,
+        question_id=question_id,
+        answer=answer,
+        score=score,
+        flag=flag,
+    )
+
+
+# Answers Submitted So Far in an Interview
+def get_interview_answers(interview_id):
+    """position -> {"question_id", "answer", "score", "flag"}; the latest submission for a position wins."""
+    answers = {}
+    rows = InterviewAnswer.objects.filter(interview_id=interview_id).order_by('position', 'created_at')
+    for row in rows.values('position', 'question_id', 'answer', 'score', 'flag'):
+        answers[row.pop('position')] = row
+    return answers
+
+
 #  Retrieve Saved Session Data
 def get_session_data(session_id):
     try:
@@ -0,0 +1,285 @@
+# interview/document_extractor.py
+# Streaming text extraction for non-PDF resumes: .docx, .txt, .rtf and .doc.
+#
+# DOCX files are read by streaming word/document.xml out of the zip through
+# lxml's iterparse, instead of building python-docx's object tree. Paragraphs
+# and table cells come out in document order (one line per table row, cells
+# separated by tabs), finished elements are dropped as we go, and extraction
+# stops at RESUME_TEXT_TARGET_CHARS.
+
+import codecs
+import re
+import zipfile
+
+from django.conf import settings
+
+from .resume_source import ResumeSource
+
+
+class DocumentTooLargeError(ValueError):
+    """The file (or the XML inside it) exceeds the configured size cap."""
+
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_PARAGRAPH, _ROW, _CELL, _RUN, _TEXT = W + 'p', W + 'tr', W + 'tc', W + 'r', W + 't'
+# Inside a run only: w:tab also defines tab stops in w:pPr/w:tabs
+_BREAKS = {W + 'tab': '\t', W + 'br': '\n', W + 'cr': '\n'}
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _check_size(source, max_bytes=None):
+    max_bytes = max_bytes or _setting('RESUME_MAX_BYTES', 10 * 1024 * 1024)
+    if source.size > max_bytes:
+        raise DocumentTooLargeError(f"{source.name} is {source.size} bytes, limit is {max_bytes}")
+
+
+class _CappedReader:
+    """File-like wrapper that refuses to decompress more than `limit` bytes."""
+
+    def __init__(self, stream, limit):
+        self.stream = stream
+        self.remaining = limit
+
+    def read(self, size=-1):
+        data = self.stream.read(size)
+        self.remaining -= len(data)
+        if self.remaining < 0:
+            raise DocumentTooLargeError("word/document.xml exceeds RESUME_DOCX_MAX_XML_BYTES")
+        return data
+
+
+def iter_docx_blocks(source, max_xml_bytes=None):
+    """
+    Yield the text of each paragraph and table row of a .docx, in order.
+
+    Memory stays flat: each paragraph / row is released once its text is
+    yielded. Paragraphs inside a cell are joined with spaces, cells with tabs.
+
+    Raises:
+        DocumentTooLargeError: if the uncompressed document XML is larger
+            than max_xml_bytes (RESUME_DOCX_MAX_XML_BYTES)
+    """
+    from lxml import etree
+
+    max_xml_bytes = max_xml_bytes or _setting('RESUME_DOCX_MAX_XML_BYTES', 50 * 1024 * 1024)
+    source = ResumeSource.coerce(source)
+
+    with source.open() as fh, zipfile.ZipFile(fh) as archive:
+        if archive.getinfo('word/document.xml').file_size > max_xml_bytes:
+            raise DocumentTooLargeError("word/document.xml exceeds RESUME_DOCX_MAX_XML_BYTES")
+
+        with archive.open('word/document.xml') as raw:
+            stream = _CappedReader(raw, max_xml_bytes)
+            elements = []   # open elements, so finished ones can be detached
+            paragraphs = []  # text parts of each open paragraph
+            rows = []        # cells of each open table row
+            cells = []       # paragraph texts of each open cell
+
+            events = etree.iterparse(stream, events=('start', 'end'),
+                                     resolve_entities=False, no_network=True)
+            for event, elem in events:
+                tag = elem.tag
+                if event == 'start':
+                    elements.append(elem)
+                    if tag == _PARAGRAPH:
+                        paragraphs.append([])
+                    elif tag == _ROW:
+                        rows.append([])
+                    elif tag == _CELL:
+                        cells.append([])
+                    continue
+
+                elements.pop()
+                block = None
+                if tag == _TEXT:
+                    if paragraphs:
+                        paragraphs[-1].append(elem.text or '')
+                elif tag in _BREAKS:
+                    if paragraphs and elements and elements[-1].tag == _RUN:
+                        paragraphs[-1].append(_BREAKS[tag])
+                elif tag == _PARAGRAPH:
+                    text = ''.join(paragraphs.pop())
+                    if cells:
+                        cells[-1].append(text)
+                    else:
+                        block = text
+                elif tag == _CELL:
+                    cell = ' '.join(text for text in cells.pop() if text)
+                    if rows:
+                        rows[-1].append(cell)
+                elif tag == _ROW:
+                    row = '\t'.join(rows.pop())
+                    if cells:
+                        # Nested table: the row belongs to the enclosing cell
+                        cells[-1].append(row)
+                    else:
+                        block = row
+
+                # Detach finished paragraphs, rows and top-level body elements
+                if elements and (tag in (_PARAGRAPH, _ROW) or len(elements) <= 2):
+                    elements[-1].remove(elem)
+
+                if block is not None:
+                    yield block
+
+
+def extract_docx_text(source, target_chars=None):
+    """Join .docx paragraphs and table rows until `target_chars` is reached."""
+    target_chars = target_chars or _setting('RESUME_TEXT_TARGET_CHARS', 50000)
+
+    parts = []
+    collected = 0
+    blocks = iter_docx_blocks(source)
+    try:
+        for text in blocks:
+            parts.append(text)
+            collected += len(text) + 1
+            if collected >= target_chars:
+                break
+    finally:
+        blocks.close()
+    return "\n".join(parts)
+
+
+def _decode(data, final=True):
+    """
+    Decode resume bytes. With final=False `data` is a prefix of the file, and
+    a character cut at its end is dropped rather than treated as an error.
+    """
+    for bom, encoding in ((codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF16_LE, 'utf-16'),
+                          (codecs.BOM_UTF16_BE, 'utf-16')):
+        if data.startswith(bom):
+            return codecs.getincrementaldecoder(encoding)(errors='replace').decode(data, final=final)
+    try:
+        return codecs.getincrementaldecoder('utf-8')().decode(data, final=final)
+    except UnicodeDecodeError:
+        return data.decode('cp1252', errors='replace')
+
+
+def extract_plain_text(source, target_chars=None):
+    """Decode a .txt resume (UTF-8 / UTF-16 with BOM, else cp1252)."""
+    target_chars = target_chars or _setting('RESUME_TEXT_TARGET_CHARS', 50000)
+    # Four bytes per character covers any UTF-8 text of target_chars length
+    buffer = source.buffer()
+    limit = target_chars * 4
+    return _decode(bytes(buffer[:limit]), final=len(buffer) <= limit)[:target_chars]
+
+
+_RTF_TOKEN = re.compile(
+    r"\\([a-z]{1,32})(-?\d{1,10})? ?|\\'([0-9a-f]{2})|\\([^a-z])|([{}])|[\r\n]+|(.)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Groups whose content is formatting or metadata, not document text
+_RTF_SKIP_DESTINATIONS = {
+    'fonttbl', 'colortbl', 'stylesheet', 'info', 'pict', 'object', 'header',
+    'footer', 'headerl', 'headerr', 'footerl', 'footerr', 'listtable',
+    'listoverridetable', 'rsidtbl', 'generator', 'themedata', 'datastore',
+    'latentstyles', 'xmlnstbl', 'mmathPr', 'fldinst',
+}
+_RTF_BREAKS = {'par': '\n', 'line': '\n', 'row': '\n', 'sect': '\n', 'page': '\n', 'tab': '\t', 'cell': '\t'}
+
+
+def extract_rtf_text(source, target_chars=None):
+    """Strip RTF control words and groups, keeping the document text."""
+    target_chars = target_chars or _setting('RESUME_TEXT_TARGET_CHARS', 50000)
+    rtf = bytes(source.buffer()).decode('latin-1')
+
+    out = []
+    collected = 0
+    stack = []
+    skipping = False
+    unicode_skip = 1      # \ucN: fallback characters that follow each \u
+    pending_skip = 0
+    for match in _RTF_TOKEN.finditer(rtf):
+        word, arg, hex_code, symbol, brace, char = match.groups()
+        if brace == '{':
+            stack.append((skipping, unicode_skip))
+            continue
+        if brace == '}':
+            if stack:
+                skipping, unicode_skip = stack.pop()
+            continue
+        if skipping:
+            continue
+        if pending_skip and (char or hex_code):
+            pending_skip -= 1
+            continue
+
+        text = None
+        if word:
+            if word in _RTF_SKIP_DESTINATIONS:
+                skipping = True
+            elif word == 'uc':
+                unicode_skip = int(arg or 1)
+            elif word == 'u' and arg:
+                text = chr(int(arg) % 0x10000)
+                pending_skip = unicode_skip
+            else:
+                text = _RTF_BREAKS.get(word)
+        elif symbol:
+            if symbol == '*':
+                skipping = True   # unknown destination, per the RTF spec
+            elif symbol in '\\{}':
+                text = symbol
+            elif symbol == '~':
+                text = ' '
+        elif hex_code:
+            text = bytes([int(hex_code, 16)]).decode('cp1252', errors='replace')
+        elif char:
+            text = char
+
+        if text:
+            out.append(text)
+            collected += len(text)
+            if collected >= target_chars:
+                break
+    return ''.join(out)
+
+
+# Legacy Word (.doc) files store text as runs of cp1252 or UTF-16LE inside an
+# OLE container; without a full OLE parser, printable runs are a good enough
+# approximation for skill and contact extraction.
+_DOC_UTF16_RUN = re.compile(rb'(?:[\x20-\x7e\t\r\n]\x00){6,}')
+_DOC_ANSI_RUN = re.compile(rb'[\x20-\x7e\t\r\n]{6,}')
+
+
+def extract_doc_text(source, target_chars=None):
+    """Best-effort text from a legacy .doc file."""
+    target_chars = target_chars or _setting('RESUME_TEXT_TARGET_CHARS', 50000)
+    data = source.buffer()
+
+    # Word writes the body in one encoding or the other, but smaller tables
+    # (font names, styles) are UTF-16 either way: keep whichever yields more
+    wide = [run.decode('utf-16-le') for run in _DOC_UTF16_RUN.findall(data)]
+    narrow = [run.decode('ascii') for run in _DOC_ANSI_RUN.findall(data)]
+    runs = max(wide, narrow, key=lambda found: sum(map(len, found)))
+    text = "\n".join(run.strip() for run in runs if run.strip())
+    return text.replace('\r', '\n')[:target_chars]
+
+
+EXTRACTORS = {
+    '.docx': extract_docx_text,
+    '.txt': extract_plain_text,
+    '.rtf': extract_rtf_text,
+    '.doc': extract_doc_text,
+}
+
+
+def extract_document_text(source, target_chars=None):
+    """
+    Extract text from a .docx / .txt / .rtf / .doc resume.
+
+    Raises:
+        DocumentTooLargeError: if the file is larger than RESUME_MAX_BYTES
+        ValueError: for any other extension
+    """
+    source = ResumeSource.coerce(source)
+    extractor = EXTRACTORS.get(source.extension)
+    if extractor is None:
+        raise ValueError(f"Unsupported file type: {source.extension}")
+    _check_size(source)
+    return extractor(source, target_chars=target_chars)
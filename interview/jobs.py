@@ -0,0 +1,131 @@
+# interview/jobs.py
+# Local background queue for resume processing (no external broker).
+#
+# Parsing (pdfplumber / OCR / spaCy) runs in sandboxed worker processes
+# (sandbox.py) with wall-clock, CPU and memory limits, so it never holds a
+# web worker or the GIL and one bad file cannot take the node down. A small
+# dispatcher thread pool in the web process feeds the sandbox and owns all
+# database writes, so job status and the resulting Resume are saved from the
+# process that has the DB connection.
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.utils.crypto import get_random_string
+
+from .models import ResumeJob
+from .resume_cache import resume_cache
+from .sandbox import ParseSandboxError, get_sandbox_pool
+
+logger = logging.getLogger(__name__)
+
+_pool_lock = threading.Lock()
+_dispatcher = None
+_pool_pid = None
+
+
+def parse_resume_file(source):
+    """Runs in a sandbox worker: extract text, skills and contact info from a ResumeSource."""
+    from .resume_parser import (
+        extract_text_from_resume, extract_skills, extract_contact_info,
+        categorize_skills, ResumeParseContext,
+    )
+
+    text = extract_text_from_resume(source)
+    if text.startswith("Error") or text.startswith("Unsupported"):
+        raise ValueError(text)
+
+    ctx = ResumeParseContext(text)
+    skills = extract_skills(ctx)
+    return {
+        "text": text,
+        "skills": skills,
+        "skill_categories": categorize_skills(skills),
+        "contact_info": extract_contact_info(ctx),
+    }
+
+
+def _get_dispatcher():
+    """Create the dispatcher lazily, and again after a fork (threads don't survive one)."""
+    global _dispatcher, _pool_pid
+
+    if _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool_pid != os.getpid():
+                workers = getattr(settings, 'RESUME_JOB_WORKERS', 2)
+                _dispatcher = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='resume-job')
+                _pool_pid = os.getpid()
+    return _dispatcher
+
+
+def _update_job(job_id, **fields):
+    job = ResumeJob.objects.get(job_id=job_id)
+    for name, value in fields.items():
+        setattr(job, name, value)
+    job.save()
+
+
+def _run_job(job_id, digest, source, username, email, on_finish=None):
+    from .db_operations import insert_parsed_resume
+
+    try:
+        _update_job(job_id, status=ResumeJob.STATUS_RUNNING)
+
+        # Another job may have parsed the same file while this one was queued
+        parsed = resume_cache.get(digest)
+        if parsed is None:
+            parsed = get_sandbox_pool().run(parse_resume_file, source)
+            resume_cache.set(digest, parsed)
+
+        insert_parsed_resume(username, email, parsed)
+        _update_job(job_id, status=ResumeJob.STATUS_DONE, skills=parsed['skills'])
+        logger.info(f"Resume job {job_id} done: {len(parsed['skills'])} skills for {username}")
+
+    except Exception as e:
+        error_code = e.code if isinstance(e, ParseSandboxError) else ParseSandboxError.FAILED
+        logger.error(f"Resume job {job_id} failed ({error_code}): {e}")
+        try:
+            _update_job(job_id, status=ResumeJob.STATUS_FAILED, error=str(e), error_code=error_code)
+        except Exception as update_error:
+            logger.error(f"Could not record failure for resume job {job_id}: {update_error}")
+    finally:
+        source.discard()
+        if on_finish:
+            on_finish()
+
+
+def submit_resume_job(username, email, digest, source, on_finish=None):
+    """
+    Queue a resume for parsing and return the ResumeJob.
+
+    `source` is a ResumeSource; it is detached from the request so it stays
+    readable after the upload's temp file is gone, and discarded when done.
+
+    The caller gets control back immediately; poll the job (or the status
+    endpoint) for queued -> running -> done / failed. `on_finish` is called
+    once the job has completed or failed (e.g. to release an admission slot).
+    """
+    detached = source.detach()
+    if detached is not source:
+        source.close()
+    source = detached
+    job = ResumeJob.objects.create(job_id=get_random_string(16), username=username)
+    _get_dispatcher().submit(_run_job, job.job_id, digest, source, username, email, on_finish)
+    return job
+
+
+def get_job_status(job_id, username):
+    """Return a JSON-ready status dict for a user's job, or None if not found."""
+    job = ResumeJob.objects.filter(job_id=job_id, username=username).first()
+    if not job:
+        return None
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "skills": job.skills if job.status == ResumeJob.STATUS_DONE else [],
+        "error": job.error,
+        "error_code": job.error_code,
+    }
@@ -0,0 +1,321 @@
+import io
+import json
+import math
+import os
+import platform
+import random
+import time
+import zipfile
+from datetime import datetime
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from interview.profiling import StageRecorder, current_rss_kb, peak_rss_kb
+from interview.providers import ocr_available
+from interview.resume_parser import PARSER_VERSION, parse_resume_complete
+from interview.skill_taxonomy import get_taxonomy
+
+
+STAGES = ["text_extraction", "ocr", "skill_matching", "contact_experience_education", "categorization", "total"]
+KINDS = ["text_pdf", "image_pdf", "docx"]
+LINES_PER_PAGE = 45
+
+REPORTED_SETTINGS = [
+    'RESUME_MAX_PAGES', 'RESUME_MAX_BYTES', 'RESUME_TEXT_TARGET_CHARS',
+    'RESUME_PARALLEL_PAGE_THRESHOLD', 'RESUME_PAGE_CHUNK', 'RESUME_PAGE_WORKERS',
+    'RESUME_DOCX_MAX_XML_BYTES', 'OCR_DPI', 'OCR_WORKERS', 'OCR_TIME_BUDGET', 'SPACY_MODEL',
+]
+
+
+# ---- synthetic resumes ----
+
+def resume_lines(pages, seed):
+    """Deterministic resume text, about LINES_PER_PAGE lines per page."""
+    rng = random.Random(seed)
+    skills = sorted(skill for group in get_taxonomy().categories.values() for skill in group)
+    n = rng.randint(100, 999)
+
+    lines = [
+        f"Jordan Example {n}",
+        f"jordan.example{n}@example.com | +1 555-{n}-0142 | linkedin.com/in/jordan-example{n}",
+        "Education",
+        "Bachelor of Technology in Computer Science, State Institute of Technology",
+        "Experience",
+    ]
+    year = rng.randint(2005, 2015)
+    while len(lines) < pages * LINES_PER_PAGE:
+        end = year + rng.randint(1, 4)
+        lines.append(f"Software Engineer, Company {rng.randint(1, 99)}  {year} - {end if end < 2024 else 'Present'}")
+        year = min(end, 2023)
+        for _ in range(rng.randint(3, 8)):
+            used = ", ".join(rng.sample(skills, 3))
+            lines.append(f"Delivered features using {used} for a team of {rng.randint(2, 20)} people.")
+    return lines[:pages * LINES_PER_PAGE]
+
+
+def _pdf_string(text):
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def text_pdf(lines):
+    """A PDF with a real text layer, written directly (Helvetica, Letter size)."""
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+    objects = [None, None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in pages:
+        body = "BT /F1 10 Tf 14 TL 50 750 Td " + " ".join(f"({_pdf_string(line)}) ' " for line in page) + "ET"
+        stream = body.encode('latin-1', errors='replace')
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (len(objects))
+        )
+        kids.append(len(objects))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, obj))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def image_pdf(lines, dpi=100):
+    """A scanned-style PDF: every page is a bitmap, there is no text layer."""
+    from PIL import Image, ImageDraw, ImageFont
+
+    try:
+        font = ImageFont.load_default(size=dpi // 6)
+    except TypeError:
+        font = ImageFont.load_default()
+    width, height = int(8.5 * dpi), 11 * dpi
+    line_height = (height - dpi) // LINES_PER_PAGE
+
+    images = []
+    for start in range(0, len(lines), LINES_PER_PAGE):
+        image = Image.new('L', (width, height), 255)
+        draw = ImageDraw.Draw(image)
+        for row, line in enumerate(lines[start:start + LINES_PER_PAGE]):
+            draw.text((dpi // 2, dpi // 2 + row * line_height), line, fill=0, font=font)
+        images.append(image)
+
+    out = io.BytesIO()
+    images[0].save(out, 'PDF', resolution=dpi, save_all=True, append_images=images[1:])
+    return out.getvalue()
+
+
+DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="word/document.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    '</Relationships>'
+)
+
+
+def docx(lines, seed):
+    """A .docx with a skills table on every page; lines after the table are paragraphs."""
+    rng = random.Random(seed)
+    categories = get_taxonomy().categories
+    skills = sorted(skill for group in categories.values() for skill in group)
+
+    def paragraph(text):
+        return f'<w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'
+
+    def cell(text):
+        return f'<w:tc>{paragraph(text)}</w:tc>'
+
+    body = []
+    for page, start in enumerate(range(0, len(lines), LINES_PER_PAGE)):
+        if page:
+            body.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+        rows = "".join(
+            f'<w:tr>{cell(category)}{cell(", ".join(rng.sample(skills, 4)))}</w:tr>'
+            for category in rng.sample(sorted(categories), min(3, len(categories)))
+        )
+        body.append(f'<w:tbl>{rows}</w:tbl>')
+        body.extend(paragraph(line) for line in lines[start:start + LINES_PER_PAGE])
+
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{"".join(body)}</w:body></w:document>'
+    )
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', DOCX_CONTENT_TYPES)
+        archive.writestr('_rels/.rels', DOCX_RELS)
+        archive.writestr('word/document.xml', document)
+    return out.getvalue()
+
+
+def build_corpus(directory, kinds, page_counts, seed):
+    """Write one file per (kind, page count) into `directory`; returns [(kind, pages, path)]."""
+    os.makedirs(directory, exist_ok=True)
+    corpus = []
+    for kind in kinds:
+        for pages in page_counts:
+            file_seed = seed * 1000 + pages
+            extension = '.docx' if kind == 'docx' else '.pdf'
+            path = os.path.join(directory, f"{kind}_{pages:02d}p_s{seed}{extension}")
+            if not os.path.exists(path):
+                lines = resume_lines(pages, file_seed)
+                if kind == 'text_pdf':
+                    data = text_pdf(lines)
+                elif kind == 'image_pdf':
+                    data = image_pdf(lines)
+                else:
+                    data = docx(lines, file_seed)
+                with open(path, 'wb') as fh:
+                    fh.write(data)
+            corpus.append((kind, pages, path))
+    return corpus
+
+
+# ---- statistics ----
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(samples):
+    seconds = [sample["seconds"] for sample in samples]
+    return {
+        "count": len(samples),
+        "p50_ms": round(percentile(seconds, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(seconds, 0.95) * 1000, 2),
+        "max_ms": round(max(seconds) * 1000, 2),
+        "max_rss_growth_mb": round(max(sample["rss_growth_kb"] for sample in samples) / 1024, 1),
+        "peak_rss_mb": round(max(sample["peak_rss_kb"] for sample in samples) / 1024, 1),
+    }
+
+
+class Command(BaseCommand):
+    help = 'Generate a synthetic resume corpus and report per-stage parse latency and memory'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pages', type=int, nargs='+', default=[1, 2, 5, 10, 20, 30],
+                            help='Page counts to generate for each kind')
+        parser.add_argument('--kinds', nargs='+', choices=KINDS, default=KINDS)
+        parser.add_argument('--repeat', type=int, default=3, help='Parses per corpus file')
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--corpus-dir', default=os.path.join(settings.BASE_DIR, 'cache', 'bench_corpus'),
+                            help='Where generated files are kept (reused across runs)')
+        parser.add_argument('--output', default='resume_benchmark.json', help='JSON results file')
+        parser.add_argument('--compare', help='Earlier results file to print p50/p95 changes against')
+        parser.add_argument('--serial', action='store_true',
+                            help='Extract every PDF in-process, so OCR time in pool workers is attributed too')
+
+    def handle(self, *args, **options):
+        corpus = build_corpus(options['corpus_dir'], options['kinds'], options['pages'], options['seed'])
+        if 'image_pdf' in options['kinds'] and not ocr_available():
+            self.stdout.write(self.style.WARNING('OCR is not available: image PDFs will yield no text.'))
+
+        overrides = {'RESUME_PARALLEL_PAGE_THRESHOLD': 10 ** 6} if options['serial'] else {}
+        with override_settings(**overrides):
+            # Load the spaCy model and matcher before measuring anything
+            warm_started = time.perf_counter()
+            parse_resume_complete(corpus[0][2])
+            warmup_seconds = time.perf_counter() - warm_started
+
+            stages, by_kind, files = {}, {}, []
+            for kind, pages, path in corpus:
+                for _ in range(options['repeat']):
+                    rss_before = current_rss_kb()
+                    started = time.perf_counter()
+                    with StageRecorder() as recorder:
+                        result = parse_resume_complete(path)
+                    total = {
+                        "seconds": time.perf_counter() - started,
+                        "rss_growth_kb": current_rss_kb() - rss_before,
+                        "peak_rss_kb": peak_rss_kb(),
+                    }
+                    recorder.samples["total"].append(total)
+
+                    for name, samples in recorder.samples.items():
+                        stages.setdefault(name, []).extend(samples)
+                    by_kind.setdefault(kind, []).append(total)
+                files.append({
+                    "kind": kind, "pages": pages, "file": os.path.basename(path),
+                    "bytes": os.path.getsize(path),
+                    "chars": len(result.get('text', '')), "skills": len(result.get('skills', [])),
+                    "error": result.get('error'),
+                    "last_ms": round(total["seconds"] * 1000, 2),
+                })
+
+        report = {
+            "generated_at": datetime.now().isoformat(timespec='seconds'),
+            "parser_version": PARSER_VERSION,
+            "taxonomy_version": get_taxonomy().version,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "ocr_available": ocr_available(),
+            "serial": options['serial'],
+            "settings": {name: getattr(settings, name, None) for name in REPORTED_SETTINGS},
+            "corpus": {"kinds": options['kinds'], "pages": options['pages'],
+                       "seed": options['seed'], "repeat": options['repeat']},
+            "warmup_ms": round(warmup_seconds * 1000, 2),
+            "stages": {name: summarize(stages[name]) for name in STAGES if name in stages},
+            "kinds": {kind: summarize(samples) for kind, samples in by_kind.items()},
+            "files": files,
+        }
+        with open(options['output'], 'w') as fh:
+            json.dump(report, fh, indent=2)
+
+        self._print_table("Stage", report["stages"])
+        self._print_table("Kind (total)", report["kinds"])
+        self.stdout.write(self.style.SUCCESS(f"✓ Results written to {options['output']}"))
+
+        if options['compare']:
+            self._compare(options['compare'], report)
+
+    def _print_table(self, title, rows):
+        self.stdout.write(f"\n{title:<30} {'n':>5} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10} {'peak MB':>9}")
+        for name, row in rows.items():
+            self.stdout.write(
+                f"{name:<30} {row['count']:>5} {row['p50_ms']:>10.1f} {row['p95_ms']:>10.1f} "
+                f"{row['max_ms']:>10.1f} {row['peak_rss_mb']:>9.1f}"
+            )
+
+    def _compare(self, path, report):
+        try:
+            with open(path) as fh:
+                baseline = json.load(fh)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Cannot read baseline {path}: {e}")
+
+        self.stdout.write(f"\nAgainst {path} (parser {baseline.get('parser_version')}):")
+        self.stdout.write(f"{'stage':<30} {'p50 change':>12} {'p95 change':>12}")
+        for name, row in report["stages"].items():
+            before = baseline.get("stages", {}).get(name)
+            if not before:
+                continue
+            changes = []
+            for key in ("p50_ms", "p95_ms"):
+                change = (row[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+                changes.append(f"{change:>+11.1f}%")
+            self.stdout.write(f"{name:<30} {changes[0]} {changes[1]}")
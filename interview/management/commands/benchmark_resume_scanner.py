@@ -0,0 +1,97 @@
+import random
+import re
+import time
+
+from django.core.management.base import BaseCommand
+
+from interview.resume_scanner import FIELD_KEYWORDS, scan_resume
+
+
+# The per-extractor patterns the scanner replaced, run the way the old
+# extract_contact_info / extract_experience_years / extract_education did:
+# one findall/finditer per pattern, each over the whole text.
+LEGACY_PHONE = [
+    r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+    r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+    r'\d{10}'
+]
+LEGACY_EXPERIENCE = [
+    r'(\d{1,2})\+?\s*years?\s+(?:of\s+)?experience',
+    r'experience[:\s]+(\d{1,2})\+?\s*years?',
+    r'(\d{4})\s*[-–—]\s*(\d{4}|present|current)',
+    r'(\d{4})\s*[-–—]\s*(\d{4})'
+]
+LEGACY_DEGREES = [
+    r'\b(Ph\.?D\.?|PhD|Doctorate)\b',
+    r'\b(Master[\'s]*|M\.?S\.?|M\.?A\.?|MBA|M\.?Tech\.?|M\.?E\.?)\b',
+    r'\b(Bachelor[\'s]*|B\.?S\.?|B\.?A\.?|B\.?Tech\.?|B\.?E\.?)\b',
+    r'\b(Associate[\'s]*|A\.?S\.?|A\.?A\.?)\b',
+    r'\b(Diploma|Certificate)\b'
+]
+
+SECTION_LINES = [
+    "Senior Software Engineer, Acme Corp {start} - {end}",
+    "Built data pipelines in Python and SQL; mentored {n} engineers.",
+    "Led migration of {n} services to Kubernetes with zero downtime.",
+    "{n}+ years of experience with distributed systems and cloud platforms.",
+    "Bachelor of Technology in Computer Science, State University",
+    "Master's in Data Science; Certificate in Machine Learning",
+    "Contact: jane.doe{n}@example.com | +1 555-{n:03d}-0199 | linkedin.com/in/jane-doe{n}",
+    "Projects: github.com/janedoe{n} - open source contributions to tooling.",
+    "Responsible for business management reporting and stakeholder updates.",
+]
+
+
+def legacy_scan(text):
+    lower = text.lower()
+    re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    for pattern in LEGACY_PHONE:
+        if re.findall(pattern, text):
+            break
+    re.findall(r'linkedin\.com/in/[\w-]+', lower)
+    re.findall(r'github\.com/[\w-]+', lower)
+    for pattern in LEGACY_EXPERIENCE:
+        for _ in re.finditer(pattern, lower):
+            pass
+    for pattern in LEGACY_DEGREES:
+        re.findall(pattern, text, re.IGNORECASE)
+    return [field for field in FIELD_KEYWORDS if field in lower]
+
+
+def synthetic_resume(lines, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(lines):
+        start = rng.randint(1995, 2022)
+        end = rng.choice([str(start + rng.randint(1, 6)), 'Present'])
+        out.append(rng.choice(SECTION_LINES).format(start=start, end=end, n=rng.randint(1, 999)))
+    return "\n".join(out)
+
+
+class Command(BaseCommand):
+    help = 'Time the single-pass resume scanner against the per-pattern extractors it replaced'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lines', type=int, nargs='+', default=[50, 500, 5000],
+                            help='Synthetic resume sizes, in lines')
+        parser.add_argument('--repeat', type=int, default=20, help='Runs per size (best is reported)')
+
+    def _best(self, func, text, repeat):
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func(text)
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        self.stdout.write(f"{'lines':>7} {'chars':>9} {'legacy ms':>10} {'scanner ms':>11} {'speedup':>8}")
+        for lines in options['lines']:
+            text = synthetic_resume(lines)
+            legacy = self._best(legacy_scan, text, repeat)
+            scanner = self._best(scan_resume, text, repeat)
+            self.stdout.write(
+                f"{lines:>7} {len(text):>9} {legacy * 1000:>10.2f} {scanner * 1000:>11.2f} "
+                f"{legacy / scanner if scanner else 0:>7.1f}x"
+            )
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from interview.skill_taxonomy import get_taxonomy
+
+
+class Command(BaseCommand):
+    help = 'Write the current skill taxonomy to a JSON artifact for SKILL_TAXONOMY_PATH'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Destination JSON file')
+
+    def handle(self, *args, **options):
+        taxonomy = get_taxonomy()
+        taxonomy.to_file(options['path'])
+
+        skill_count = sum(len(skills) for skills in taxonomy.categories.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Wrote {len(taxonomy.categories)} categories ({skill_count} skills) '
+            f'to {options["path"]} - version {taxonomy.version}'
+        ))
@@ -0,0 +1,292 @@
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from interview.answer_evaluation import answer_scorer, flag_for_score, next_level_from_flag
+from interview.batch_scoring import BatchScorer
+from interview.models import InterviewSession
+from interview.mongo_conn import get_collection
+from interview.question_store import question_store
+
+
+# Only what re-scoring reads; everything else stays on the server
+SESSION_PROJECTION = {
+    "_id": 1, "session_id": 1, "answers": 1, "score": 1, "current_level": 1,
+    "evaluation_flag": 1, "recommended_next_level": 1, "flag_records": 1,
+}
+
+# Stored fields a re-score can change, as reported in the diff statistics
+CHANGE_FIELDS = ("score", "evaluation_flag", "recommended_next_level", "answers")
+
+# question text -> (question id, keywords, keyword tokens); set in each process
+_questions = {}
+
+
+def question_map():
+    """Current questions by text, the key InterviewSession.answers uses (lowest id wins on duplicates)."""
+    questions = {}
+    for record in sorted(question_store.all(), key=lambda r: r["id"]):
+        questions.setdefault(record["question_text"], (record["id"], record["keywords"], record["keyword_tokens"]))
+    return questions
+
+
+def _init_worker(questions):
+    global _questions
+    _questions = questions
+
+
+def rescore_batch(docs, threshold_same, threshold_higher):
+    """
+    Re-score a batch of session documents with the current keywords and thresholds.
+
+    Answers to questions that still exist (matched by text) are scored
+    against their current keyword tokens; answers to questions deleted or
+    renamed since are scored against the keywords stored with the answer.
+    Returns (_id, changed fields, diff) for every document.
+    """
+    token_sets, pairs = {}, []
+    for doc in docs:
+        for text, entry in (doc.get("answers") or {}).items():
+            entry = entry if isinstance(entry, dict) else {"answer": entry}
+            current = _questions.get(text)
+            if current is not None:
+                key, keywords, tokens = current
+                token_sets.setdefault(key, tokens)
+            else:
+                keywords = entry.get("keywords") or []
+                key = ("stored", text, tuple(keywords))
+                if key not in token_sets:
+                    token_sets[key] = answer_scorer.keyword_tokens(keywords)
+            pairs.append((doc["_id"], text, entry, key, keywords))
+
+    scores = BatchScorer(token_sets).score([p[2].get("answer") or "" for p in pairs], [p[3] for p in pairs])
+
+    by_session = {}
+    for (doc_id, text, entry, key, keywords), score in zip(pairs, scores):
+        by_session.setdefault(doc_id, []).append((text, entry, key, keywords, float(score)))
+
+    results = []
+    for doc in docs:
+        results.append(_rescored_session(doc, by_session.get(doc["_id"], []), threshold_same, threshold_higher))
+    return results
+
+
+def _rescored_session(doc, scored, threshold_same, threshold_higher):
+    answers, per_question = {}, {}
+    for text, entry, key, keywords, score in scored:
+        answers[text] = {**entry, "score": round(score, 2), "keywords": list(keywords)}
+        per_question[str(key) if isinstance(key, int) else text] = {
+            "score": round(score, 2), "flag": flag_for_score(score, threshold_same, threshold_higher),
+        }
+
+    # Average over the stored answers, as the session was scored. Only a
+    # question_count written by an earlier re-score is kept: per_question
+    # of older sessions lists every question in the level, not those served.
+    previous_record = doc.get("flag_records") or {}
+    question_count = previous_record.get("question_count") or len(doc.get("answers") or {})
+    avg = sum(item[4] for item in scored) / question_count if question_count else 0.0
+    overall_flag = flag_for_score(avg, threshold_same, threshold_higher)
+    current_level = doc.get("current_level") or "beginner"
+
+    fields = {
+        "answers": answers,
+        "score": round(avg, 2),
+        "evaluation_flag": overall_flag,
+        "recommended_next_level": next_level_from_flag(current_level, overall_flag),
+        "flag_records": {
+            **previous_record,
+            "user_id": previous_record.get("user_id"),
+            "field": previous_record.get("field", "general"),
+            "level": current_level,
+            "per_question": per_question,
+            "question_count": question_count,
+            "avg_score": round(avg, 2),
+            "overall_flag": overall_flag,
+            "rescored_at": datetime.utcnow().isoformat(),
+        },
+    }
+
+    diff = {
+        "score": fields["score"] != doc.get("score"),
+        "evaluation_flag": overall_flag != doc.get("evaluation_flag"),
+        "recommended_next_level": fields["recommended_next_level"] != doc.get("recommended_next_level"),
+        "answers": answers != (doc.get("answers") or {}),
+        "score_delta": fields["score"] - (doc.get("score") or 0.0),
+        "flag_change": (doc.get("evaluation_flag"), overall_flag),
+        "answer_count": len(scored),
+    }
+    if not any(diff[name] for name in CHANGE_FIELDS):
+        return doc["_id"], None, diff
+    return doc["_id"], fields, diff
+
+
+def _batches(cursor, size):
+    batch = []
+    for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class Command(BaseCommand):
+    help = ('Re-score saved interview sessions with the current question keywords and flag thresholds, '
+            'streaming from MongoDB and writing back in unordered bulk updates')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Sessions per read / bulk write')
+        parser.add_argument('--workers', type=int, default=0,
+                            help='Scoring processes (0 scores in this process)')
+        parser.add_argument('--threshold-same', type=float, default=0.5,
+                            help='Scores below this are flagged "Easier"')
+        parser.add_argument('--threshold-higher', type=float, default=0.8,
+                            help='Scores at or above this are flagged "Harder"')
+        parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+        parser.add_argument('--checkpoint', default='rescore_sessions.checkpoint.json',
+                            help='File recording the last session written, updated after every batch')
+        parser.add_argument('--resume', action='store_true', help='Continue after the checkpoint')
+        parser.add_argument('--limit', type=int, default=0, help='Stop after this many sessions (0 = all)')
+        parser.add_argument('--pause', type=float, default=0.0,
+                            help='Seconds to sleep after each bulk write, to leave room for live traffic')
+        parser.add_argument('--report-every', type=int, default=20, help='Print progress every N batches')
+
+    def handle(self, *args, **options):
+        from bson import json_util
+
+        if options['batch_size'] <= 0:
+            raise CommandError('--batch-size must be positive')
+        self.options = options
+        thresholds = (options['threshold_same'], options['threshold_higher'])
+
+        query, self.totals = {}, Counter()
+        if options['resume']:
+            try:
+                with open(options['checkpoint']) as fh:
+                    checkpoint = json_util.loads(fh.read())
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Cannot read checkpoint {options['checkpoint']}: {e}")
+            query = {"_id": {"$gt": checkpoint["last_id"]}}
+            self.totals.update(checkpoint.get("totals", {}))
+            self.stdout.write(f"Resuming after {checkpoint['last_id']} ({self.totals['sessions']} sessions done)")
+
+        questions = question_map()
+        _init_worker(questions)
+        self.collection = get_collection(InterviewSession)
+
+        cursor = self.collection.find(query, SESSION_PROJECTION, no_cursor_timeout=True,
+                                      batch_size=options['batch_size']).sort("_id", 1)
+        if options['limit']:
+            cursor = cursor.limit(options['limit'])
+
+        executor = None
+        if options['workers'] > 0:
+            executor = ProcessPoolExecutor(options['workers'], initializer=_init_worker, initargs=(questions,))
+
+        # Score changes are multiples of 0.01, so a histogram keeps the stats bounded
+        self.run, self.deltas, self.flag_changes = Counter(), Counter(), Counter()
+        self.started = time.perf_counter()
+        try:
+            # Results are consumed in submission order, so the checkpoint
+            # always covers a contiguous prefix of the collection
+            pending = deque()
+            in_flight = max(1, options['workers'] * 2)
+            for batch_number, batch in enumerate(_batches(cursor, options['batch_size']), 1):
+                if executor:
+                    pending.append((batch[-1]["_id"], executor.submit(rescore_batch, batch, *thresholds)))
+                else:
+                    pending.append((batch[-1]["_id"], rescore_batch(batch, *thresholds)))
+                while len(pending) >= in_flight:
+                    self._finish(*pending.popleft())
+                if batch_number % options['report_every'] == 0:
+                    self._progress()
+            while pending:
+                self._finish(*pending.popleft())
+        finally:
+            cursor.close()
+            if executor:
+                executor.shutdown()
+
+        self._report()
+
+    def _finish(self, last_id, results):
+        """Tally a scored batch, write its changes and move the checkpoint past it."""
+        from pymongo import UpdateOne
+
+        if hasattr(results, 'result'):
+            results = results.result()
+
+        updates = []
+        for doc_id, fields, diff in results:
+            self.run['sessions'] += 1
+            self.run['answers'] += diff['answer_count']
+            for name in CHANGE_FIELDS:
+                self.run[f'changed_{name}'] += diff[name]
+            if fields is not None:
+                self.run['changed_sessions'] += 1
+                self.deltas[round(diff['score_delta'], 2)] += 1
+                if diff['evaluation_flag']:
+                    self.flag_changes[diff['flag_change']] += 1
+                updates.append(UpdateOne({"_id": doc_id}, {"$set": fields}))
+
+        if self.options['dry_run']:
+            return
+        if updates:
+            written = self.collection.bulk_write(updates, ordered=False)
+            self.run['written'] += written.modified_count
+            if self.options['pause']:
+                time.sleep(self.options['pause'])
+        self.totals['sessions'] += len(results)
+        self.totals['changed_sessions'] += len(updates)
+        self._save_checkpoint(last_id)
+
+    def _save_checkpoint(self, last_id):
+        from bson import json_util
+
+        path = self.options['checkpoint']
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as fh:
+            fh.write(json_util.dumps({
+                "last_id": last_id,
+                "totals": dict(self.totals),
+                "updated_at": datetime.now().isoformat(timespec='seconds'),
+            }))
+        os.replace(tmp_path, path)
+
+    def _progress(self):
+        run, elapsed = self.run, time.perf_counter() - self.started
+        self.stdout.write(
+            f"{run['sessions']:>10} sessions  {run['changed_sessions']:>9} changed  "
+            f"{run['sessions'] / elapsed:>9.0f} sessions/s  {run['answers'] / elapsed:>10.0f} answers/s"
+        )
+
+    def _report(self):
+        run, elapsed = self.run, time.perf_counter() - self.started
+        dry_run = self.options['dry_run']
+        self.stdout.write(f"\n{'Dry run: would change' if dry_run else 'Changed'} "
+                          f"{run['changed_sessions']} of {run['sessions']} sessions")
+        for name in CHANGE_FIELDS:
+            self.stdout.write(f"  {name:<24} {run[f'changed_{name}']:>10}")
+
+        if self.deltas:
+            values = sorted(self.deltas.elements())
+            mean = sum(values) / len(values)
+            self.stdout.write(
+                f"  score change: mean {mean:+.3f}, min {values[0]:+.2f}, "
+                f"median {values[len(values) // 2]:+.2f}, max {values[-1]:+.2f}"
+            )
+        for (before, after), count in self.flag_changes.most_common():
+            self.stdout.write(f"  flag {before} -> {after}: {count}")
+
+        if elapsed > 0:
+            self.stdout.write(
+                f"\n{elapsed:.1f}s  {run['sessions'] / elapsed:.0f} sessions/s  "
+                f"{run['answers'] / elapsed:.0f} answers/s"
+            )
+        if not dry_run:
+            self.stdout.write(self.style.SUCCESS(f"✓ {run['written']} sessions written"))
@@ -0,0 +1,72 @@
+import os
+import re
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+class Command(BaseCommand):
+    help = 'Report per-module import cost when starting a management command (python -X importtime)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'target', nargs='*', default=['check'],
+            help='Management command (and arguments) to profile, default: check'
+        )
+        parser.add_argument('--top', type=int, default=20, help='Number of modules to list')
+        parser.add_argument(
+            '--packages', action='store_true',
+            help='Aggregate self time by top-level package instead of listing modules'
+        )
+
+    def handle(self, *args, **options):
+        manage_py = os.path.join(settings.BASE_DIR, 'manage.py')
+        cmd = [sys.executable, '-X', 'importtime', manage_py] + options['target']
+
+        self.stdout.write(f"Profiling: {' '.join(options['target'])}")
+        proc = subprocess.run(cmd, capture_output=True, text=True, cwd=settings.BASE_DIR)
+
+        modules = []
+        for line in proc.stderr.splitlines():
+            match = IMPORTTIME_LINE.match(line)
+            if match:
+                self_us, cumulative_us, indent, name = match.groups()
+                modules.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+
+        if not modules:
+            self.stdout.write(self.style.ERROR('No import timing data captured.'))
+            if proc.stderr:
+                self.stdout.write(proc.stderr[-2000:])
+            return
+
+        total_ms = sum(m[1] for m in modules) / 1000
+        self.stdout.write(f"Modules imported: {len(modules)}   Total import time: {total_ms:.1f} ms\n")
+
+        if options['packages']:
+            by_package = {}
+            for name, self_us, _, _ in modules:
+                package = name.split('.')[0]
+                by_package[package] = by_package.get(package, 0) + self_us
+            rows = sorted(by_package.items(), key=lambda row: row[1], reverse=True)[:options['top']]
+            self.stdout.write(f"{'self ms':>10}  package")
+            for package, self_us in rows:
+                self.stdout.write(f"{self_us / 1000:>10.1f}  {package}")
+        else:
+            # Cumulative time surfaces the modules that pull in expensive import chains
+            rows = sorted(modules, key=lambda m: m[2], reverse=True)[:options['top']]
+            self.stdout.write(f"{'cumul ms':>10} {'self ms':>9}  module")
+            for name, self_us, cumulative_us, _ in rows:
+                self.stdout.write(f"{cumulative_us / 1000:>10.1f} {self_us / 1000:>9.1f}  {name}")
+
+        heavy = [m[0] for m in modules if m[0].split('.')[0] in ('spacy', 'pytesseract', 'pdf2image', 'pdfplumber')]
+        if heavy:
+            self.stdout.write(self.style.WARNING(
+                f"\nResume parsing stack imported at startup ({len(heavy)} modules), e.g. {heavy[0]}"
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS('\n✓ spaCy / OCR / PDF stack not imported at startup'))
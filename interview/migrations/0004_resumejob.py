@@ -0,0 +1,32 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:12
+
+from django.db import migrations, models
+import djongo.models.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0003_auto_20251113_1742'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_id', models.CharField(max_length=32, unique=True)),
+                ('username', models.CharField(max_length=100)),
+                ('status', models.CharField(default='queued', max_length=20)),
+                ('skills', djongo.models.fields.JSONField(default=list)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Resume Job',
+                'verbose_name_plural': 'Resume Jobs',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
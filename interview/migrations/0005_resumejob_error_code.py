@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0004_resumejob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumejob',
+            name='error_code',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 3.2.25 on 2026-10-18 12:30
+
+from django.db import migrations
+import djongo.models.fields
+
+
+INDEXES = [
+    ('question_normalized_keywords', [('normalized_keywords', 1)]),
+    ('question_keyword_terms', [('keyword_terms', 1)]),
+    ('question_level_keyword_terms', [('level', 1), ('keyword_terms', 1)]),
+]
+
+
+def backfill_keywords(apps, schema_editor):
+    from pymongo import UpdateOne
+    from interview.mongo_conn import get_collection
+    from interview.question_index import normalize_keyword, keyword_terms
+
+    collection = get_collection(apps.get_model('interview', 'Question'))
+    batch = []
+    for doc in collection.find({}, {'_id': 1, 'keywords': 1}):
+        keywords = doc.get('keywords') or []
+        batch.append(UpdateOne({'_id': doc['_id']}, {'$set': {
+            'normalized_keywords': sorted({normalize_keyword(k) for k in keywords} - {''}),
+            'keyword_terms': keyword_terms(keywords),
+        }}))
+        if len(batch) >= 1000:
+            collection.bulk_write(batch, ordered=False)
+            batch = []
+    if batch:
+        collection.bulk_write(batch, ordered=False)
+
+
+def create_indexes(apps, schema_editor):
+    from interview.mongo_conn import get_collection
+
+    collection = get_collection(apps.get_model('interview', 'Question'))
+    for name, keys in INDEXES:
+        collection.create_index(keys, name=name)
+
+
+def drop_indexes(apps, schema_editor):
+    from interview.mongo_conn import get_collection
+
+    collection = get_collection(apps.get_model('interview', 'Question'))
+    existing = collection.index_information()
+    for name, _ in INDEXES:
+        if name in existing:
+            collection.drop_index(name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0005_resumejob_error_code'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='normalized_keywords',
+            field=djongo.models.fields.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='keyword_terms',
+            field=djongo.models.fields.JSONField(default=list),
+        ),
+        migrations.RunPython(backfill_keywords, migrations.RunPython.noop),
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 3.2.25 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0006_question_keyword_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InterviewAnswer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('interview_id', models.CharField(db_index=True, max_length=100)),
+                ('username', models.CharField(max_length=100)),
+                ('position', models.IntegerField()),
+                ('question_id', models.IntegerField()),
+                ('answer', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Interview Answer',
+                'verbose_name_plural': 'Interview Answers',
+                'ordering': ['interview_id', 'position', 'created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.2.25 on 2026-10-18 14:40
+
+from django.db import migrations
+import djongo.models.fields
+
+
+def backfill_keyword_tokens(apps, schema_editor):
+    from pymongo import UpdateOne
+    from interview.answer_evaluation import answer_scorer
+    from interview.mongo_conn import get_collection
+
+    collection = get_collection(apps.get_model('interview', 'Question'))
+    batch = []
+    for doc in collection.find({}, {'_id': 1, 'keywords': 1}):
+        tokens = answer_scorer.keyword_tokens(doc.get('keywords') or [])
+        batch.append(UpdateOne({'_id': doc['_id']}, {'$set': {'keyword_tokens': sorted(tokens)}}))
+        if len(batch) >= 1000:
+            collection.bulk_write(batch, ordered=False)
+            batch = []
+    if batch:
+        collection.bulk_write(batch, ordered=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0007_interviewanswer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='keyword_tokens',
+            field=djongo.models.fields.JSONField(default=list),
+        ),
+        migrations.RunPython(backfill_keyword_tokens, migrations.RunPython.noop),
+    ]
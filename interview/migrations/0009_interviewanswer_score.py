@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0008_question_keyword_tokens'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewanswer',
+            name='score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='interviewanswer',
+            name='flag',
+            field=models.CharField(blank=True, default='', max_length=20),
+        ),
+    ]
@@ -24,13 +24,54 @@ class Resume(models.Model):
         ordering = ['-uploaded_at']
 
 
+#  Background Resume Processing Job
+class ResumeJob(models.Model):
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    job_id = models.CharField(max_length=32, unique=True)
+    username = models.CharField(max_length=100)
+    status = models.CharField(max_length=20, default=STATUS_QUEUED)
+    skills = models.JSONField(default=list)
+    error = models.TextField(blank=True, null=True)
+    error_code = models.CharField(max_length=32, blank=True, default='')  # parse_timeout, parse_oom, ...
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Resume job {self.job_id} ({self.status}) - {self.username}"
+
+    class Meta:
+        verbose_name = "Resume Job"
+        verbose_name_plural = "Resume Jobs"
+        ordering = ['-created_at']
+
+
 #  Question Storage Model
 class Question(models.Model):
     keywords = models.JSONField(default=list)  # list of keywords
+    # Derived from keywords on save, for indexed lookups in MongoDB
+    # (see question_index.py): normalized whole keywords, and every phrase in them
+    normalized_keywords = models.JSONField(default=list)
+    keyword_terms = models.JSONField(default=list)
+    # Tokens answers are scored against (answer_evaluation.AnswerScorer), also derived on save
+    keyword_tokens = models.JSONField(default=list)
     level = models.CharField(max_length=50, default="beginner")
     question_text = models.TextField()
     answer = models.TextField(blank=True, null=True)
 
+    def save(self, *args, **kwargs):
+        from .answer_evaluation import answer_scorer
+        from .question_index import normalize_keyword, keyword_terms
+
+        keywords = self.keywords or []
+        self.normalized_keywords = sorted({normalize_keyword(k) for k in keywords} - {""})
+        self.keyword_terms = keyword_terms(keywords)
+        self.keyword_tokens = sorted(answer_scorer.keyword_tokens(keywords))
+        super().save(*args, **kwargs)
+
     def __str__(self):
         level_str = self.level.capitalize() if self.level else "Unknown"
         keywords_str = ', '.join(self.keywords) if self.keywords else "No keywords"
@@ -64,6 +105,26 @@ class InterviewSession(models.Model):
         ordering = ['-created_at']
 
 
+#  Interview Answer (one per submitted question, append-only)
+class InterviewAnswer(models.Model):
+    interview_id = models.CharField(max_length=100, db_index=True)  # becomes InterviewSession.session_id
+    username = models.CharField(max_length=100)
+    position = models.IntegerField()  # index of the question in the interview
+    question_id = models.IntegerField()
+    answer = models.TextField(blank=True, default='')
+    score = models.FloatField(default=0)  # scored on submit
+    flag = models.CharField(max_length=20, blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Answer {self.position + 1} of {self.interview_id} - {self.username}"
+
+    class Meta:
+        verbose_name = "Interview Answer"
+        verbose_name_plural = "Interview Answers"
+        ordering = ['interview_id', 'position', 'created_at']
+
+
 #  Profile Model (Authenticated User)
 class Profile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
@@ -0,0 +1,34 @@
+# interview/mongo_conn.py
+# Direct pymongo access for queries djongo cannot push down to MongoDB.
+#
+# The client is built from DATABASES['default'] (the same server and
+# database djongo uses) and created per process, since MongoClient must not
+# be shared across a fork.
+
+import os
+import threading
+
+from django.conf import settings
+
+_client = None
+_client_pid = None
+_client_lock = threading.Lock()
+
+
+def get_db():
+    """The pymongo Database behind the default djongo connection."""
+    global _client, _client_pid
+    config = settings.DATABASES['default']
+    if _client_pid != os.getpid():
+        with _client_lock:
+            if _client_pid != os.getpid():
+                from pymongo import MongoClient
+
+                _client = MongoClient(**config.get('CLIENT', {}))
+                _client_pid = os.getpid()
+    return _client[config['NAME']]
+
+
+def get_collection(model):
+    """The collection djongo stores `model` in."""
+    return get_db()[model._meta.db_table]
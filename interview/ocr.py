@@ -0,0 +1,126 @@
+# interview/ocr.py
+# Bounded-memory OCR for scanned PDFs.
+#
+# Pages are rasterized one at a time at OCR_DPI and recognized by tesseract
+# on a small thread pool (both pdftoppm and tesseract run as subprocesses, so
+# threads don't contend on the GIL). At most OCR_WORKERS page images exist at
+# once. A per-document time budget bounds the whole run; when it runs out the
+# pages done so far are returned with truncated=True.
+
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from django.conf import settings
+
+from .providers import get_ocr
+from .resume_source import ResumeSource
+
+
+OcrResult = namedtuple("OcrResult", ["text", "pages", "truncated"])
+
+
+def _page_count(ocr, source):
+    if source.path:
+        info = ocr.pdf2image.pdfinfo_from_path(source.path)
+    else:
+        info = ocr.pdf2image.pdfinfo_from_bytes(bytes(source.data))
+    return int(info["Pages"])
+
+
+def _rasterize_page(ocr, source, page_number, dpi, timeout):
+    options = dict(dpi=dpi, first_page=page_number, last_page=page_number, timeout=timeout)
+    if source.path:
+        return ocr.pdf2image.convert_from_path(source.path, **options)
+    return ocr.pdf2image.convert_from_bytes(bytes(source.data), **options)
+
+
+def _ocr_page(ocr, source, page_number, dpi, deadline):
+    """Rasterize and recognize a single page; the image is dropped right after."""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return None
+
+    try:
+        images = _rasterize_page(ocr, source, page_number, dpi, remaining)
+    except ocr.pdf2image.exceptions.PDFPopplerTimeoutError:
+        return None
+    if not images:
+        return ""
+    image = images[0]
+    try:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        return ocr.pytesseract.image_to_string(image, timeout=remaining)
+    except RuntimeError:
+        # pytesseract raises RuntimeError when its timeout expires
+        return None
+    finally:
+        image.close()
+
+
+def ocr_pdf(pdf_path, first_page=None, last_page=None, dpi=None, workers=None, time_budget=None):
+    """
+    OCR pages first_page..last_page (1-based, inclusive) of a PDF.
+
+    Args:
+        pdf_path: path, buffer or ResumeSource for the PDF
+        first_page, last_page: page range, defaults to the whole document
+        dpi: rasterization resolution (OCR_DPI)
+        workers: pages processed concurrently (OCR_WORKERS)
+        time_budget: seconds for the whole document (OCR_TIME_BUDGET)
+
+    Returns:
+        OcrResult(text, pages, truncated): the joined text of completed pages,
+        the per-page texts (None for pages not done) and whether the time
+        budget ran out first
+
+    Raises:
+        ProviderUnavailableError: if pytesseract / pdf2image are missing
+    """
+    ocr = get_ocr()
+    source = ResumeSource.coerce(pdf_path)
+    dpi = dpi or getattr(settings, 'OCR_DPI', 200)
+    workers = workers or getattr(settings, 'OCR_WORKERS', 2)
+    time_budget = time_budget if time_budget is not None else getattr(settings, 'OCR_TIME_BUDGET', 30)
+
+    first_page = first_page or 1
+    last_page = last_page or _page_count(ocr, source)
+    page_numbers = list(range(first_page, last_page + 1))
+    deadline = time.monotonic() + time_budget
+
+    pages = [None] * len(page_numbers)
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ocr')
+    pending = {}
+    try:
+        next_index = 0
+
+        # Sliding window: keep at most `workers` pages in flight
+        while next_index < len(page_numbers) or pending:
+            while (next_index < len(page_numbers) and len(pending) < workers
+                   and time.monotonic() < deadline):
+                future = pool.submit(_ocr_page, ocr, source, page_numbers[next_index], dpi, deadline)
+                pending[future] = next_index
+                next_index += 1
+
+            if not pending:
+                break  # budget exhausted before the remaining pages were started
+
+            done, _ = wait(pending, timeout=max(0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                break  # budget exhausted while pages were still running
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    pages[index] = future.result()
+                except Exception as e:
+                    print(f"OCR error on page {page_numbers[index]}: {e}")
+                    pages[index] = ""
+    finally:
+        # Pages still running hit their own tesseract / pdftoppm timeouts
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    truncated = any(page is None for page in pages)
+    text = "\n".join(page for page in pages if page)
+    return OcrResult(text, pages, truncated)
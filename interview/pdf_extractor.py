@@ -0,0 +1,183 @@
+# interview/pdf_extractor.py
+# Streaming, page-parallel PDF text extraction.
+#
+# Pages are yielded one at a time instead of being concatenated in memory.
+# Long documents are split into page ranges that are extracted in a process
+# pool. Pages without a text layer are OCR'd (consecutive scanned pages as one
+# parallel OCR run) under a per-document time budget, and extraction stops
+# once enough text has been collected for skill extraction.
+#
+# The OCR budget is one wall-clock deadline (time.time(), which unlike
+# time.monotonic() is comparable across processes) shared by every page range
+# of the document, so pool chunks cannot each spend the full budget.
+
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+
+from .ocr import ocr_pdf
+from .profiling import stage
+from .providers import ocr_available
+from .resume_source import ResumeSource
+
+
+class PdfTooLargeError(ValueError):
+    """The file exceeds RESUME_MAX_BYTES."""
+
+
+_page_pool = None
+_page_pool_pid = None
+_page_pool_lock = threading.Lock()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _get_page_pool():
+    global _page_pool, _page_pool_pid
+    if _page_pool_pid != os.getpid():
+        with _page_pool_lock:
+            if _page_pool_pid != os.getpid():
+                _page_pool = ProcessPoolExecutor(max_workers=_setting('RESUME_PAGE_WORKERS', 4))
+                _page_pool_pid = os.getpid()
+    return _page_pool
+
+
+def shutdown_page_pool():
+    """Stop this process's page pool, if it has one; the next long PDF starts a fresh pool."""
+    global _page_pool, _page_pool_pid
+    with _page_pool_lock:
+        pool, pid = _page_pool, _page_pool_pid
+        _page_pool = _page_pool_pid = None
+    if pool is not None and pid == os.getpid():
+        pool.shutdown(wait=True)
+
+
+def _ocr_run(source, page_numbers, deadline):
+    """OCR a run of consecutive scanned pages, yielding one text per page."""
+    budget = deadline - time.time()
+    pages = [None] * len(page_numbers)
+    if budget > 0:
+        try:
+            with stage("ocr"):
+                result = ocr_pdf(source, first_page=page_numbers[0], last_page=page_numbers[-1],
+                                 time_budget=budget)
+            pages = result.pages
+            if result.truncated:
+                print(f"OCR time budget exhausted on pages {page_numbers[0]}-{page_numbers[-1]}")
+        except Exception as e:
+            print(f"OCR error: {e}")
+    for text in pages:
+        yield text or ""
+
+
+def _iter_page_texts(source, pdf, start, stop, deadline):
+    """Yield text for pages [start, stop) of an open PDF, OCR'ing pages without a text layer."""
+    use_ocr = ocr_available()
+    scanned = []
+    for index in range(start, stop):
+        page = pdf.pages[index]
+        text = page.extract_text() or ""
+        # Drop pdfminer's per-page layout cache as we go
+        page.close()
+
+        if use_ocr and not text.strip():
+            scanned.append(index + 1)
+            continue
+        if scanned:
+            yield from _ocr_run(source, scanned, deadline)
+            scanned = []
+        yield text
+
+    if scanned:
+        yield from _ocr_run(source, scanned, deadline)
+
+
+def extract_page_range(source, start, stop, deadline):
+    """
+    Extract pages [start, stop) (0-based). Runs in a pool process for long PDFs.
+
+    `deadline` is the document's OCR deadline as a time.time() timestamp.
+    """
+    import pdfplumber
+
+    with source.open() as fh, pdfplumber.open(fh) as pdf:
+        return list(_iter_page_texts(source, pdf, start, min(stop, len(pdf.pages)), deadline))
+
+
+def iter_pdf_pages(source, max_pages=None, max_bytes=None, parallel_threshold=None, chunk_pages=None):
+    """
+    Yield the text of each page of a PDF, in order.
+
+    Args:
+        source: path, buffer or ResumeSource for the PDF
+        max_pages: only the first `max_pages` pages are read (RESUME_MAX_PAGES)
+        max_bytes: refuse files larger than this (RESUME_MAX_BYTES)
+        parallel_threshold: page count above which pages are fanned out to
+            the process pool (RESUME_PARALLEL_PAGE_THRESHOLD)
+        chunk_pages: pages per pool task (RESUME_PAGE_CHUNK)
+
+    Raises:
+        PdfTooLargeError: if the file is larger than max_bytes
+    """
+    import pdfplumber
+
+    max_pages = max_pages or _setting('RESUME_MAX_PAGES', 30)
+    max_bytes = max_bytes or _setting('RESUME_MAX_BYTES', 10 * 1024 * 1024)
+    parallel_threshold = parallel_threshold or _setting('RESUME_PARALLEL_PAGE_THRESHOLD', 8)
+    chunk_pages = chunk_pages or _setting('RESUME_PAGE_CHUNK', 4)
+    ocr_budget = _setting('OCR_TIME_BUDGET', 30)
+
+    source = ResumeSource.coerce(source)
+    size = source.size
+    if size > max_bytes:
+        raise PdfTooLargeError(f"PDF is {size} bytes, limit is {max_bytes}")
+
+    deadline = time.time() + ocr_budget
+    with source.open() as fh, pdfplumber.open(fh) as pdf:
+        page_count = min(len(pdf.pages), max_pages)
+
+        if page_count <= parallel_threshold:
+            yield from _iter_page_texts(source, pdf, 0, page_count, deadline)
+            return
+
+    # Long document: fan page ranges out, then yield them back in order.
+    pool = _get_page_pool()
+    futures = [
+        pool.submit(extract_page_range, source, start, min(start + chunk_pages, page_count), deadline)
+        for start in range(0, page_count, chunk_pages)
+    ]
+    try:
+        for future in futures:
+            for text in future.result():
+                yield text
+    finally:
+        # Consumer stopped early (enough text) - don't run the remaining chunks
+        for future in futures:
+            future.cancel()
+
+
+def extract_pdf_text(source, target_chars=None, **limits):
+    """
+    Join page text until `target_chars` (RESUME_TEXT_TARGET_CHARS) is reached.
+
+    The page cap, size cap and parallelism are passed through to iter_pdf_pages.
+    """
+    target_chars = target_chars or _setting('RESUME_TEXT_TARGET_CHARS', 50000)
+
+    parts = []
+    collected = 0
+    pages = iter_pdf_pages(source, **limits)
+    try:
+        for text in pages:
+            parts.append(text)
+            collected += len(text)
+            if collected >= target_chars:
+                break
+    finally:
+        pages.close()
+    return "\n".join(parts)
@@ -0,0 +1,77 @@
+# interview/profiling.py
+# Opt-in per-stage timing for the resume parser.
+#
+# Parser code wraps each stage in `with stage("name"):`. Outside a
+# StageRecorder that is a single ContextVar lookup; inside one (the
+# benchmark_resume_parser command) every stage records its wall time, the
+# RSS it added and the process's peak RSS when it finished. Work done in pool
+# processes is only visible as the time the caller spent waiting for it.
+
+import resource
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+_recorder = ContextVar("stage_recorder", default=None)
+_PAGE_KB = resource.getpagesize() // 1024
+
+
+def current_rss_kb():
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * _PAGE_KB
+    except OSError:
+        return 0
+
+
+def peak_rss_kb():
+    # ru_maxrss is in kB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class StageRecorder:
+    """
+    Collects stage samples while active:
+
+        with StageRecorder() as recorder:
+            parse_resume_complete(path)
+        recorder.samples  # {"text_extraction": [{"seconds": ..., ...}], ...}
+    """
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self._token = None
+
+    def __enter__(self):
+        self._token = _recorder.set(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        _recorder.reset(self._token)
+        self._token = None
+
+    def add(self, name, seconds, rss_growth_kb, peak_kb):
+        self.samples[name].append({
+            "seconds": seconds,
+            "rss_growth_kb": rss_growth_kb,
+            "peak_rss_kb": peak_kb,
+        })
+
+
+@contextmanager
+def stage(name):
+    """Time the enclosed block as `name` if a StageRecorder is active."""
+    recorder = _recorder.get()
+    if recorder is None:
+        yield
+        return
+
+    rss_before = current_rss_kb()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.add(name, time.perf_counter() - started,
+                     current_rss_kb() - rss_before, peak_rss_kb())
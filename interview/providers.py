@@ -0,0 +1,121 @@
+# interview/providers.py
+# Lazily loaded heavy dependencies for resume parsing.
+#
+# Nothing here imports spaCy or the OCR stack at module import time, so
+# management commands, tests and worker boot never pay for them unless a
+# resume is actually parsed.
+
+import threading
+from collections import namedtuple
+
+from django.conf import settings
+
+
+# Only tokenization and NER are used; skip loading the rest of the pipeline.
+UNUSED_PIPES = ["tagger", "parser", "lemmatizer", "attribute_ruler", "senter"]
+
+OcrBackend = namedtuple("OcrBackend", ["pytesseract", "pdf2image"])
+
+
+class ProviderUnavailableError(RuntimeError):
+    """A lazily loaded dependency is missing or failed to load."""
+
+
+class LazyProvider:
+    """
+    Thread-safe, load-once holder for an expensive resource.
+
+    The loader runs at most once per process; both the result and a
+    ProviderUnavailableError are cached so a missing dependency fails fast
+    on every later call instead of retrying the import.
+    """
+
+    def __init__(self, name, loader):
+        self.name = name
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._value = None
+        self._error = None
+        self._loaded = False
+
+    def get(self):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    try:
+                        self._value = self._loader()
+                    except ProviderUnavailableError as e:
+                        self._error = e
+                    self._loaded = True
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def available(self):
+        try:
+            self.get()
+            return True
+        except ProviderUnavailableError:
+            return False
+
+    @property
+    def loaded(self):
+        return self._loaded and self._error is None
+
+    def reset(self):
+        with self._lock:
+            self._value = None
+            self._error = None
+            self._loaded = False
+
+
+def _load_spacy_model():
+    model_name = getattr(settings, 'SPACY_MODEL', 'en_core_web_sm')
+    try:
+        import spacy
+    except ImportError as e:
+        raise ProviderUnavailableError(
+            "spaCy is not installed. Install the packages in requirements.txt."
+        ) from e
+
+    try:
+        return spacy.load(model_name, exclude=UNUSED_PIPES)
+    except OSError as e:
+        raise ProviderUnavailableError(
+            f"spaCy model '{model_name}' is not installed. "
+            f"Run: python -m spacy download {model_name}"
+        ) from e
+
+
+def _load_ocr():
+    try:
+        import pytesseract
+    except ImportError as e:
+        raise ProviderUnavailableError(
+            "OCR not available. Install pytesseract to process scanned PDFs."
+        ) from e
+    try:
+        import pdf2image
+    except ImportError as e:
+        raise ProviderUnavailableError(
+            "pdf2image not installed. Cannot perform OCR on scanned PDFs."
+        ) from e
+    return OcrBackend(pytesseract, pdf2image)
+
+
+nlp_provider = LazyProvider("spaCy model", _load_spacy_model)
+ocr_provider = LazyProvider("OCR", _load_ocr)
+
+
+def get_nlp():
+    """Return the shared spaCy pipeline, loading it on first use."""
+    return nlp_provider.get()
+
+
+def get_ocr():
+    """Return the OCR backend (pytesseract + pdf2image), loading it on first use."""
+    return ocr_provider.get()
+
+
+def ocr_available():
+    return ocr_provider.available()
@@ -0,0 +1,202 @@
+# interview/question_index.py
+# Inverted keyword index over the question bank.
+#
+# Keywords are normalized (lowercase, tokens of letters / digits / + # .) and
+# every contiguous run of their tokens is indexed, so "machine learning"
+# answers to "machine learning", "machine" and "learning". A skill matches a
+# question when:
+#   - the skill is a keyword, or a whole-token phrase inside one
+#     ("learning" -> "machine learning"),
+#   - a keyword is a whole-token phrase inside the skill
+#     ("python" -> skill "python scripting"),
+#   - or, for skills of MIN_PREFIX characters or more, the skill's tokens
+#     start an indexed phrase ("java" -> "java spring"), looked up in a
+#     marisa-trie. Prefixes end on a token boundary, so "java" does not
+#     match "javascript" nor "sql" match "sqlite".
+# Unlike the old substring test, "c" no longer matches every keyword with a
+# "c" in it, and lookup cost depends on the number of matches, not the bank.
+
+import re
+import threading
+
+MIN_PREFIX = 3
+MAX_PHRASE_TOKENS = 4
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def tokenize(text):
+    """Normalized tokens of a keyword or skill: "Node.js / React" -> ["node.js", "react"]."""
+    return [token.rstrip('.') for token in _TOKEN.findall((text or "").lower())]
+
+
+def normalize_keyword(keyword):
+    """Canonical form of a keyword: its tokens joined by single spaces."""
+    return " ".join(tokenize(keyword))
+
+
+def keyword_terms(keywords):
+    """Every indexed phrase of a keyword list, as stored on Question.keyword_terms."""
+    terms = set()
+    for keyword in keywords or []:
+        terms |= phrases(tokenize(keyword))
+    return sorted(terms)
+
+
+def phrases(tokens, max_tokens=MAX_PHRASE_TOKENS):
+    """Every contiguous run of up to max_tokens tokens, joined with spaces."""
+    found = set()
+    for start in range(len(tokens)):
+        for stop in range(start + 1, min(len(tokens), start + max_tokens) + 1):
+            found.add(" ".join(tokens[start:stop]))
+    return found
+
+
+class KeywordIndex:
+    """
+    keyword phrase -> question ids, plus a prefix trie over the phrases.
+
+    Posting sets are replaced, never mutated, so readers need no lock; the
+    trie is rebuilt lazily, on the first prefix lookup after new phrases
+    were added (removed phrases simply have no postings left).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keywords = {}   # full keyword -> frozenset(ids)
+        self._phrases = {}    # phrase inside a keyword -> frozenset(ids)
+        self._trie = None
+        self._trie_dirty = True
+
+    @classmethod
+    def build(cls, records):
+        index = cls()
+        keywords, phrases_ = {}, {}
+        for record in records:
+            for keyword, keyword_phrases in _keyword_phrases(record):
+                keywords.setdefault(keyword, set()).add(record["id"])
+                for phrase in keyword_phrases:
+                    phrases_.setdefault(phrase, set()).add(record["id"])
+        index._keywords = {key: frozenset(ids) for key, ids in keywords.items()}
+        index._phrases = {key: frozenset(ids) for key, ids in phrases_.items()}
+        return index
+
+    # ---- incremental updates ----
+
+    def add(self, record):
+        with self._lock:
+            for keyword, keyword_phrases in _keyword_phrases(record):
+                _post(self._keywords, keyword, record["id"])
+                for phrase in keyword_phrases:
+                    if phrase not in self._phrases:
+                        self._trie_dirty = True
+                    _post(self._phrases, phrase, record["id"])
+
+    def discard(self, record):
+        with self._lock:
+            for keyword, keyword_phrases in _keyword_phrases(record):
+                _unpost(self._keywords, keyword, record["id"])
+                for phrase in keyword_phrases:
+                    _unpost(self._phrases, phrase, record["id"])
+
+    # ---- lookup ----
+
+    def _prefix_trie(self):
+        if self._trie_dirty:
+            import marisa_trie
+
+            with self._lock:
+                if self._trie_dirty:
+                    self._trie = marisa_trie.Trie(self._phrases.keys())
+                    self._trie_dirty = False
+        return self._trie
+
+    def match_terms(self, skills):
+        """
+        What `skills` hit, as (phrases, keywords): indexed phrases the skills
+        equal or start (as whole tokens), and whole keywords contained in a
+        skill.
+        """
+        phrase_hits, keyword_hits = set(), set()
+        for skill in skills:
+            tokens = tokenize(skill)
+            if not tokens:
+                continue
+            phrase = " ".join(tokens)
+
+            if phrase in self._phrases:
+                phrase_hits.add(phrase)
+            if len(phrase) >= MIN_PREFIX:
+                phrase_hits.update(key for key in self._prefix_trie().keys(phrase + " ") if key in self._phrases)
+
+            # Keywords contained in the skill ("python" in "python scripting")
+            keyword_hits.update(part for part in phrases(tokens, max_tokens=len(tokens)) if part in self._keywords)
+        return phrase_hits, keyword_hits
+
+    def match(self, skills):
+        """Ids of every question matching at least one of `skills`."""
+        phrase_hits, keyword_hits = self.match_terms(skills)
+        matched = set()
+        for term in phrase_hits:
+            matched.update(self._phrases.get(term, ()))
+        for term in keyword_hits:
+            matched.update(self._keywords.get(term, ()))
+        return matched
+
+
+def mongo_filter(skills):
+    """
+    The same matching rules as KeywordIndex.match, as a MongoDB filter over
+    Question.keyword_terms / normalized_keywords (both multikey-indexed).
+    Prefix lookups are anchored regexes ending on a token boundary, which
+    MongoDB answers from the index.
+    Returns None when no skill has any tokens.
+    """
+    clauses, exact, contained = [], set(), set()
+    for skill in skills:
+        tokens = tokenize(skill)
+        if not tokens:
+            continue
+        phrase = " ".join(tokens)
+        if len(phrase) >= MIN_PREFIX:
+            clauses.append({"keyword_terms": {"$regex": "^" + re.escape(phrase) + "( |$)"}})
+        else:
+            exact.add(phrase)
+        contained |= phrases(tokens, max_tokens=len(tokens))
+
+    if exact:
+        clauses.append({"keyword_terms": {"$in": sorted(exact)}})
+    if contained:
+        clauses.append({"normalized_keywords": {"$in": sorted(contained)}})
+    return {"$or": clauses} if clauses else None
+
+
+def record_terms(record):
+    """Every term a question is indexed under: its keywords and their phrases."""
+    terms = set()
+    for keyword, keyword_phrases in _keyword_phrases(record):
+        terms.add(keyword)
+        terms |= keyword_phrases
+    return terms
+
+
+def _keyword_phrases(record):
+    for keyword in record.get("keywords") or []:
+        tokens = tokenize(keyword)
+        if tokens:
+            yield " ".join(tokens), phrases(tokens)
+
+
+def _post(postings, key, question_id):
+    postings[key] = postings.get(key, frozenset()) | {question_id}
+
+
+def _unpost(postings, key, question_id):
+    ids = postings.get(key)
+    if ids is None or question_id not in ids:
+        return
+    ids = ids - {question_id}
+    if ids:
+        postings[key] = ids
+    else:
+        del postings[key]
@@ -0,0 +1,168 @@
+# interview/question_ranker.py
+# Relevance ranking of questions against a candidate's skills.
+#
+# Questions are rows of a sparse question x term matrix (terms are the
+# normalized keywords and keyword phrases from question_index.py), weighted
+# by IDF and L2-normalized per row, stored column-major: for each term, the
+# rows containing it and their weights. A query is the set of terms the
+# skills hit in the keyword index, weighted by IDF, so the product is
+# one np.bincount over the concatenated postings of those terms.
+#
+# Questions saved or deleted after the matrix was built are kept in a small
+# pending set, scored in Python and merged into the result; the matrix is
+# rebuilt from the store once the pending set outgrows REBUILD_FRACTION of
+# the bank.
+
+import math
+import threading
+
+from .question_index import record_terms
+
+REBUILD_FRACTION = 0.02
+MIN_REBUILD = 64
+
+
+class _TermMatrix:
+    """Immutable CSC-style matrix built from a records snapshot."""
+
+    def __init__(self, records):
+        import numpy as np
+
+        postings = {}
+        rows = []
+        for row, record in enumerate(records):
+            rows.append(record)
+            for term in record_terms(record):
+                postings.setdefault(term, []).append(row)
+
+        self.size = len(rows)
+        self.row_ids = np.array([record["id"] for record in rows], dtype=np.int64)
+        self.row_of = {record["id"]: row for row, record in enumerate(rows)}
+        self.levels = sorted({record["level"] for record in rows if record["level"]})
+        level_code = {level: code for code, level in enumerate(self.levels)}
+        self.row_levels = np.array([level_code.get(record["level"], -1) for record in rows], dtype=np.int16)
+
+        self.terms = {term: column for column, term in enumerate(postings)}
+        self.idf = np.array(
+            [math.log((1 + self.size) / (1 + len(postings[term]))) + 1 for term in postings],
+            dtype=np.float32,
+        )
+
+        # Row norms over IDF weights, so long keyword lists are not favored
+        squared = np.zeros(self.size, dtype=np.float64)
+        lengths = np.array([len(postings[term]) for term in postings], dtype=np.int64)
+        self.indptr = np.zeros(len(postings) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.indptr[1:])
+        self.indices = np.fromiter(
+            (row for term in postings for row in postings[term]), dtype=np.int32, count=int(self.indptr[-1])
+        )
+        column_idf = np.repeat(self.idf, lengths)
+        np.add.at(squared, self.indices, column_idf.astype(np.float64) ** 2)
+        self.norms = np.sqrt(squared).astype(np.float32)
+        self.norms[self.norms == 0] = 1.0
+        self.data = column_idf / self.norms[self.indices]
+
+    def idf_of(self, term):
+        column = self.terms.get(term)
+        if column is None:
+            return math.log((1 + self.size) / 2) + 1
+        return float(self.idf[column])
+
+    def scores(self, terms):
+        """Dense score vector for a query made of `terms` (one weighted bincount)."""
+        import numpy as np
+
+        columns = [self.terms[term] for term in terms if term in self.terms]
+        if not columns:
+            return np.zeros(self.size, dtype=np.float32)
+        slices = [slice(self.indptr[c], self.indptr[c + 1]) for c in columns]
+        rows = np.concatenate([self.indices[s] for s in slices])
+        weights = np.concatenate([self.data[s] * self.idf[c] for s, c in zip(slices, columns)])
+        return np.bincount(rows, weights=weights, minlength=self.size).astype(np.float32)
+
+
+class QuestionRanker:
+    """
+    Ranks question ids by relevance; kept in step with the QuestionStore.
+
+    `source` returns the store's current records dict; it is read under the
+    ranker's lock when the matrix is (re)built, copying its values in one
+    list() call since the store updates the dict in place. The store calls reset() on
+    (re)load and update() / remove() after swapping in a changed snapshot.
+    """
+
+    def __init__(self, source):
+        self._source = source
+        self._lock = threading.Lock()
+        self._matrix = None
+        self._pending = {}   # id -> record, or None when deleted
+        self.version = 0
+
+    def reset(self):
+        with self._lock:
+            self._matrix = None
+            self._pending = {}
+
+    def update(self, record):
+        with self._lock:
+            if self._matrix is not None:
+                pending = dict(self._pending)
+                pending[record["id"]] = record
+                self._pending = pending
+
+    def remove(self, question_id):
+        with self._lock:
+            if self._matrix is not None:
+                pending = dict(self._pending)
+                pending[question_id] = None
+                self._pending = pending
+
+    def _current(self):
+        matrix, pending = self._matrix, self._pending
+        if matrix is None or len(pending) > max(MIN_REBUILD, REBUILD_FRACTION * matrix.size):
+            with self._lock:
+                if self._matrix is matrix:
+                    self._matrix = _TermMatrix(list(self._source().values()))
+                    self._pending = {}
+                    self.version += 1
+                matrix, pending = self._matrix, self._pending
+        return matrix, pending
+
+    def top(self, terms, limit, level=None):
+        """
+        Ids of the `limit` most relevant questions for the query `terms`,
+        best first (ties by id); questions that share no term are left out.
+        """
+        import numpy as np
+
+        matrix, pending = self._current()
+        if not terms or limit <= 0:
+            return []
+        scores = matrix.scores(terms)
+
+        # Rows superseded by pending changes, and rows at other levels, drop out
+        stale = [matrix.row_of[qid] for qid in pending if qid in matrix.row_of]
+        if stale:
+            scores[stale] = 0
+        if level is not None:
+            code = matrix.levels.index(level) if level in matrix.levels else -2
+            scores[matrix.row_levels != code] = 0
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > limit:
+            # Keep everything tied with the limit-th score so ties break by id
+            cutoff = np.partition(scores[candidates], len(candidates) - limit)[len(candidates) - limit]
+            candidates = candidates[scores[candidates] >= cutoff]
+        ranked = [(float(scores[row]), int(matrix.row_ids[row])) for row in candidates]
+
+        for qid, record in pending.items():
+            if record is None or (level is not None and record["level"] != level):
+                continue
+            row_terms = record_terms(record)
+            norm = math.sqrt(sum(matrix.idf_of(term) ** 2 for term in row_terms)) or 1.0
+            score = sum(matrix.idf_of(term) ** 2 for term in row_terms & terms) / norm
+            if score > 0:
+                ranked.append((score, qid))
+
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        return [qid for _, qid in ranked[:limit]]
@@ -0,0 +1,181 @@
+# interview/question_sampler.py
+# Stratified random selection of interview questions.
+#
+# An interview gets LEVEL_QUOTAS questions per level, drawn at random from the
+# most relevant questions for the candidate's skills: the top
+# quota * QUESTION_RANK_POOL of the level by IDF-weighted keyword overlap
+# (question_ranker.py). Candidates with the same skills get different, but
+# still on-topic, questions. Short levels are backfilled from the other
+# matches, then from the whole bank, always by id. Only ids are sampled;
+# records are fetched for the chosen ten. With QUESTION_LOOKUP_BACKEND =
+# "mongo" each level is one $match + $sample aggregation on the server,
+# over all matches rather than the most relevant ones.
+#
+# Many candidates list the same skills, so the pools sampled from are
+# memoized per (skill signature, level) in CandidatePoolCache; starting an
+# interview for a common profile is then a cache lookup plus ten random picks.
+
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+from .question_index import mongo_filter, normalize_keyword
+from .question_store import question_store
+
+LEVEL_QUOTAS = [("beginner", 4), ("intermediate", 3), ("hard", 3)]
+INTERVIEW_SIZE = sum(quota for _, quota in LEVEL_QUOTAS)
+
+
+def _sample_excluding(pool, k, exclude, rng):
+    """Up to k random ids from `pool` (a sequence) that are not in `exclude`."""
+    if k <= 0 or not pool:
+        return []
+    picked = []
+    for qid in rng.sample(pool, min(len(pool), k + len(exclude))):
+        if qid not in exclude:
+            picked.append(qid)
+            if len(picked) == k:
+                break
+    return picked
+
+
+def skill_signature(skills):
+    """Canonical form of a skill list: its normalized skills, deduplicated and sorted."""
+    return tuple(sorted({normalize_keyword(skill) for skill in skills or []} - {""}))
+
+
+class CandidatePoolCache:
+    """
+    LRU + TTL memo of candidate pools, keyed by (skill signature, level).
+
+    A pool is the tuple of ids an interview samples from: the ranked top of
+    one level, or (level None) every matching id, used for backfill. Entries
+    belong to one question-bank version and are dropped when it changes.
+    Size and lifetime come from QUESTION_POOL_CACHE_SIZE / _TTL; hit / miss
+    counters are per process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key -> (created, pool)
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key, version, build):
+        """The cached pool for `key` at bank `version`, or build() it and cache the result."""
+        now = time.monotonic()
+        ttl = getattr(settings, 'QUESTION_POOL_CACHE_TTL', 600)
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] <= ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        pool = tuple(build())
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = (now, pool)
+                self._entries.move_to_end(key)
+                max_entries = getattr(settings, 'QUESTION_POOL_CACHE_SIZE', 1024)
+                while len(self._entries) > max_entries:
+                    self._entries.popitem(last=False)
+        return pool
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+            }
+
+
+candidate_pools = CandidatePoolCache()
+
+
+def sample_question_ids(skills, rng=None):
+    """Ids for one interview from the in-process question store, in level order."""
+    rng = rng or random
+    signature = skill_signature(skills)
+    version = question_store.current_version()
+    pool_factor = getattr(settings, 'QUESTION_RANK_POOL', 3)
+
+    def pool(level, build):
+        return candidate_pools.get_or_build((signature, level), version, build)
+
+    matched = pool(None, lambda: sorted(question_store.match_ids(signature))) if signature else ()
+
+    selected = []
+    chosen = set()
+    for level, quota in LEVEL_QUOTAS:
+        if matched:
+            candidates = pool(level, lambda: question_store.rank(signature, quota * pool_factor, level=level))
+        else:
+            # No skill matched anything: draw from the level's whole pool
+            candidates = question_store.level_ids(level)
+        for qid in _sample_excluding(candidates, quota, chosen, rng):
+            selected.append(qid)
+            chosen.add(qid)
+
+    # Backfill short levels: other matches first, then anything in the bank
+    missing = INTERVIEW_SIZE - len(selected)
+    if missing > 0 and matched:
+        extra = _sample_excluding(matched, missing, chosen, rng)
+        selected.extend(extra)
+        chosen.update(extra)
+        missing -= len(extra)
+    if missing > 0:
+        selected.extend(_sample_excluding(question_store.level_ids(), missing, chosen, rng))
+    return selected
+
+
+def sample_questions_from_mongo(skills):
+    """One $match + $sample aggregation per level, plus backfill, on the server."""
+    from .db_operations import QUESTION_PROJECTION, question_from_document
+    from .models import Question
+    from .mongo_conn import get_collection
+
+    collection = get_collection(Question)
+    skill_query = mongo_filter(skills) if skills else None
+
+    def sample(match, size):
+        if size <= 0:
+            return []
+        pipeline = [{"$match": match}, {"$sample": {"size": size}}, {"$project": QUESTION_PROJECTION}]
+        return list(collection.aggregate(pipeline))
+
+    selected = []
+    for level, quota in LEVEL_QUOTAS:
+        level_match = {"level": level, **skill_query} if skill_query else {"level": level}
+        selected.extend(sample(level_match, quota))
+
+    for match in ([skill_query] if skill_query else []) + [{}]:
+        missing = INTERVIEW_SIZE - len(selected)
+        if missing <= 0:
+            break
+        taken = {"id": {"$nin": [doc["id"] for doc in selected]}}
+        selected.extend(sample({**match, **taken}, missing))
+
+    return [question_from_document(doc) for doc in selected]
+
+
+def sample_interview_questions(skills, rng=None):
+    """Question records for one interview: 4 beginner, 3 intermediate, 3 hard when available."""
+    if getattr(settings, 'QUESTION_LOOKUP_BACKEND', 'memory') == 'mongo':
+        return sample_questions_from_mongo(skills)
+    return question_store.get_many(sample_question_ids(skills, rng))
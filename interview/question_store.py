@@ -0,0 +1,184 @@
+# interview/question_store.py
+# Process-wide, read-mostly cache of the question bank.
+#
+# The store is filled once (at warm-up or on first use) and kept current by
+# the Question post_save / post_delete signals. Other workers pick up changes
+# when their copy is older than QUESTION_STORE_TTL seconds. A KeywordIndex
+# (question_index.py) is built with every load and updated with every change,
+# so skill lookups never scan the bank; a QuestionRanker (question_ranker.py)
+# orders the matches by relevance.
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+from .answer_evaluation import answer_scorer
+from .question_index import KeywordIndex
+from .question_ranker import QuestionRanker
+
+logger = logging.getLogger(__name__)
+
+
+def question_to_dict(q):
+    """Serialize a Question into the plain dict used across views and utils."""
+    keywords = q.keywords if q.keywords else []
+    return {
+        "id": q.id,
+        "keywords": keywords,
+        "keyword_tokens": stored_keyword_tokens(q.keyword_tokens, keywords),
+        "question_text": q.question_text,
+        "level": q.level,
+        "answer": q.answer,
+    }
+
+
+def stored_keyword_tokens(tokens, keywords):
+    """A question's answer-scoring tokens as a frozenset; derived from keywords if never stored."""
+    if tokens or not keywords:
+        return frozenset(tokens or ())
+    return answer_scorer.keyword_tokens(keywords)
+
+
+class QuestionStore:
+    """
+    All questions by id, updated in place.
+
+    Writers change the dict under the lock, one key at a time, so a save is
+    O(1) however large the bank is. Lookups by id need no lock; readers that
+    iterate take a copy first (list(values()), or items under the lock).
+    `version` increases on every change so dependent caches can tell when to
+    rebuild. A stale store is reloaded by one thread while the others keep
+    reading the current records.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._load_lock = threading.RLock()
+        self._records = None
+        self._index = KeywordIndex()
+        self._ranker = QuestionRanker(lambda: self._records or {})
+        self._level_ids = (None, {})
+        self._loaded_at = 0.0
+        self.version = 0
+
+    def _ttl(self):
+        return getattr(settings, 'QUESTION_STORE_TTL', 300)
+
+    def _stale(self, records):
+        return records is None or time.monotonic() - self._loaded_at > self._ttl()
+
+    def _snapshot(self):
+        records = self._records
+        if not self._stale(records):
+            return records
+        # Single flight: only the first load makes others wait
+        if not self._load_lock.acquire(blocking=records is None):
+            return records
+        try:
+            records = self._records
+            if self._stale(records):
+                records = self.load()
+            return records
+        finally:
+            self._load_lock.release()
+
+    def load(self):
+        """(Re)load every question from the database."""
+        from .models import Question
+
+        with self._load_lock:
+            records = {q.id: question_to_dict(q) for q in Question.objects.all()}
+            index = KeywordIndex.build(records.values())
+            with self._lock:
+                self._records = records
+                self._index = index
+                self._ranker.reset()
+                self._loaded_at = time.monotonic()
+                self.version += 1
+        logger.info(f"Question store loaded {len(records)} questions (version {self.version})")
+        return records
+
+    @property
+    def loaded(self):
+        return self._records is not None
+
+    def current_version(self):
+        """`version` after reloading a stale snapshot, for keying dependent caches."""
+        self._snapshot()
+        return self.version
+
+    def all(self):
+        return list(self._snapshot().values())
+
+    def get(self, question_id):
+        return self._snapshot().get(question_id)
+
+    def get_many(self, question_ids):
+        """Return records for `question_ids` in the given order, skipping unknown ids."""
+        records = self._snapshot()
+        return [record for record in map(records.get, question_ids) if record is not None]
+
+    def match_ids(self, skills):
+        """Ids of every question whose keywords match any of `skills`."""
+        records = self._snapshot()
+        return {qid for qid in self._index.match(skills) if qid in records}
+
+    def level_ids(self, level=None):
+        """
+        Tuple of question ids at `level` (every id when level is None).
+        Rebuilt only when the bank changes, so sampling never copies records.
+        """
+        self._snapshot()
+        version, by_level = self._level_ids
+        if version != self.version:
+            with self._lock:
+                items, version = list((self._records or {}).items()), self.version
+            grouped = {None: [qid for qid, _ in items]}
+            for qid, record in items:
+                grouped.setdefault(record["level"], []).append(qid)
+            by_level = {name: tuple(ids) for name, ids in grouped.items()}
+            self._level_ids = (version, by_level)
+        return by_level.get(level, ())
+
+    def rank(self, skills, limit, level=None):
+        """Ids of up to `limit` questions matching `skills` (optionally at `level`), most relevant first."""
+        self._snapshot()
+        phrase_hits, keyword_hits = self._index.match_terms(skills)
+        return self._ranker.top(phrase_hits | keyword_hits, limit, level=level)
+
+    def search(self, skills, limit, level=None):
+        """Records of up to `limit` questions whose keywords match any of `skills`, most relevant first."""
+        return self.get_many(self.rank(skills, limit, level=level))
+
+    def upsert(self, question):
+        with self._lock:
+            if self._records is None:
+                return
+            record = question_to_dict(question)
+            previous = self._records.get(question.id)
+            self._records[question.id] = record
+            if previous is not None:
+                self._index.discard(previous)
+            self._index.add(record)
+            self._ranker.update(record)
+            self.version += 1
+
+    def remove(self, question_id):
+        with self._lock:
+            if self._records is None or question_id not in self._records:
+                return
+            self._index.discard(self._records.pop(question_id))
+            self._ranker.remove(question_id)
+            self.version += 1
+
+    def invalidate(self):
+        with self._lock:
+            self._records = None
+            self._index = KeywordIndex()
+            self._ranker.reset()
+            self.version += 1
+
+
+question_store = QuestionStore()
@@ -0,0 +1,91 @@
+# interview/resume_cache.py
+# Content-addressed resume storage and parse-result cache.
+#
+# Uploads are identified by their SHA-256. Parse results are cached under the
+# content hash plus the parser and taxonomy versions, so a repeat upload skips
+# text extraction, OCR and spaCy entirely. Keeping the original file is a
+# separate, optional step (RESUME_STORE_ORIGINALS): it is stored once as
+# MEDIA_ROOT/resumes/<sha256><ext>, so users' "resume.pdf" never collide.
+
+import os
+import tempfile
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+CACHE_ALIAS = 'resume_parse'
+
+
+def store_original(source, digest):
+    """
+    Keep a copy of the uploaded resume under its content hash.
+
+    Returns the stored path; an existing copy of the same content is reused.
+    """
+    directory = os.path.join(settings.MEDIA_ROOT, 'resumes')
+    path = os.path.join(directory, f"{digest}{source.extension}")
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.upload-')
+    try:
+        with os.fdopen(fd, 'wb') as destination:
+            destination.write(source.buffer())
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+class ResumeParseCache:
+    """
+    Parse results keyed by content hash + parser version + taxonomy version.
+
+    Storage and eviction come from the Django cache configured as
+    CACHES['resume_parse'] (MAX_ENTRIES / CULL_FREQUENCY bound its size).
+    Hit / miss counters are per process.
+    """
+
+    def __init__(self, alias=CACHE_ALIAS):
+        self.alias = alias
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def key(self, digest):
+        from .resume_parser import PARSER_VERSION
+        from .skill_taxonomy import get_taxonomy
+        return f"resume:{digest}:{PARSER_VERSION}:{get_taxonomy().version}"
+
+    def get(self, digest):
+        result = self.backend.get(self.key(digest))
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def set(self, digest, parsed):
+        self.backend.set(self.key(digest), parsed)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+resume_cache = ResumeParseCache()
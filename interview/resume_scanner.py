@@ -0,0 +1,137 @@
+# interview/resume_scanner.py
+# Single-pass regex scanner for contact, experience and education details.
+#
+# All patterns used by extract_contact_info, extract_experience_years and
+# extract_education are compiled once into one alternation and the resume
+# text is walked a single time. Each match is dispatched on its group name.
+
+import re
+from datetime import date
+
+
+FIELD_KEYWORDS = [
+    'computer science', 'engineering', 'mathematics', 'physics',
+    'business', 'management', 'data science', 'artificial intelligence',
+    'information technology', 'software engineering', 'electrical',
+    'mechanical', 'civil', 'chemical', 'biotechnology'
+]
+
+# (group name, pattern), written for lowercased text. At any position the
+# first alternative that matches wins, so more specific patterns come first.
+_PATTERNS = [
+    ('email', r'[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z|]{2,}\b'),
+    ('linkedin', r'linkedin\.com/in/[\w-]+'),
+    ('github', r'github\.com/[\w-]+'),
+    ('exp_range', r'(?P<range_start>\d{4})\s*[-–—]\s*(?P<range_end>\d{4}|present|current)'),
+    ('exp_years', r'(?P<years_before>\d{1,2})\+?\s*years?\s+(?:of\s+)?experience'),
+    ('exp_years_after', r'experience[:\s]+(?P<years_after>\d{1,2})\+?\s*years?'),
+    ('phone1', r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
+    ('phone2', r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
+    ('phone3', r'\d{10}'),
+    ('degree_phd', r'(?:ph\.?d\.?|phd|doctorate)\b'),
+    ('degree_master', r'(?:master[\'s]*|m\.?s\.?|m\.?a\.?|mba|m\.?tech\.?|m\.?e\.?)\b'),
+    ('degree_bachelor', r'(?:bachelor[\'s]*|b\.?s\.?|b\.?a\.?|b\.?tech\.?|b\.?e\.?)\b'),
+    ('degree_associate', r'(?:associate[\'s]*|a\.?s\.?|a\.?a\.?)\b'),
+    ('degree_other', r'(?:diploma|certificate)\b'),
+    ('field', '|'.join(re.escape(field) for field in sorted(FIELD_KEYWORDS, key=len, reverse=True))),
+]
+
+# Matches only start at the beginning of a word. Besides skipping almost
+# every position cheaply (the bulk of the speedup over running each pattern
+# separately), this stops "121 years" reading as 21 years.
+SCANNER = re.compile(
+    r'(?<!\w)(?:' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _PATTERNS) + ')'
+)
+
+_PHONE_KINDS = ('phone1', 'phone2', 'phone3')
+_DEGREE_KINDS = ('degree_phd', 'degree_master', 'degree_bachelor', 'degree_associate', 'degree_other')
+
+
+def scan_resume(text, today=None, lower=None):
+    """
+    Extract contact, experience and education details in one pass over `text`.
+
+    Args:
+        text: resume text
+        today: callable returning a date, used for "present"/"current" ranges
+            (defaults to date.today)
+        lower: `text.lower()`, if the caller already has it
+
+    Returns:
+        dict with 'contact' (email, phone, linkedin, github), 'experience'
+        (total_years, experience_entries) and 'education' (degrees, fields)
+    """
+    text = text or ""
+    lower = text.lower() if lower is None else lower
+    # Emails and degrees are reported with their original casing; lower()
+    # can change the length of some non-ASCII text, in which case offsets
+    # into `text` no longer line up and the lowercased value is kept.
+    original = text if len(text) == len(lower) else lower
+    today = today or date.today
+    current_year = None
+
+    contact = {'email': None, 'phone': None, 'linkedin': None, 'github': None}
+    phones = {}
+    stated_years = 0
+    entries = []
+    degrees = {kind: [] for kind in _DEGREE_KINDS}
+    fields_seen = set()
+
+    for match in SCANNER.finditer(lower):
+        # The outer group closes last, so lastgroup names the alternative
+        kind = match.lastgroup
+        start, end = match.span(kind)
+        value = original[start:end]
+
+        if kind == 'email':
+            if contact['email'] is None:
+                contact['email'] = value
+        elif kind in ('linkedin', 'github'):
+            if contact[kind] is None:
+                contact[kind] = match.group(kind)
+        elif kind in _PHONE_KINDS:
+            phones.setdefault(kind, value)
+        elif kind == 'exp_range':
+            start_year = int(match.group('range_start'))
+            end = match.group('range_end').lower()
+            if end in ('present', 'current'):
+                if current_year is None:
+                    current_year = today().year
+                end_year = current_year
+            else:
+                end_year = int(end)
+            years = end_year - start_year
+            if 0 < years < 50:
+                entries.append(years)
+        elif kind == 'exp_years':
+            stated_years = max(stated_years, int(match.group('years_before')))
+        elif kind == 'exp_years_after':
+            stated_years = max(stated_years, int(match.group('years_after')))
+        elif kind in degrees:
+            degrees[kind].append(value)
+        elif kind == 'field':
+            fields_seen.add(match.group(kind))
+
+    for kind in _PHONE_KINDS:
+        if kind in phones:
+            contact['phone'] = phones[kind]
+            break
+
+    # A field keyword also counts when it is part of a longer match ("engineering" within "software engineering")
+    fields = [
+        field.title() for field in FIELD_KEYWORDS
+        if any(field in seen for seen in fields_seen)
+    ]
+
+    return {
+        'contact': contact,
+        'experience': {
+            'total_years': sum(entries) if entries else stated_years,
+            'experience_entries': entries,
+        },
+        'education': {
+            'degrees': [degree for kind in _DEGREE_KINDS for degree in degrees[kind]],
+            'fields': fields,
+        },
+    }
+
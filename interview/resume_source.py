@@ -0,0 +1,147 @@
+# interview/resume_source.py
+# Resume input abstraction: a file on disk or an in-memory buffer.
+#
+# Small uploads (InMemoryUploadedFile) are parsed straight from their bytes
+# with no disk I/O. Large uploads (TemporaryUploadedFile) are memory-mapped
+# from Django's temp file. Extractors get a seekable binary stream either way.
+
+import hashlib
+import io
+import mmap
+import os
+import shutil
+import tempfile
+
+from django.utils.crypto import get_random_string
+
+
+def _sniff_extension(head):
+    if head.startswith(b'%PDF'):
+        return '.pdf'
+    if head.startswith(b'PK'):
+        return '.docx'
+    if head.startswith(b'{\\rtf'):
+        return '.rtf'
+    if head.startswith(b'\xd0\xcf\x11\xe0'):
+        return '.doc'
+    return ''
+
+
+class ResumeSource:
+    """
+    A resume to parse, backed by either a path or a bytes-like buffer.
+
+    Instances pickle cheaply (path or bytes only), so they can be handed to
+    pool processes. `owned` sources point at a private spooled copy that
+    discard() deletes once parsing is done.
+    """
+
+    def __init__(self, path=None, data=None, name=None, owned=False):
+        if (path is None) == (data is None):
+            raise ValueError("ResumeSource needs exactly one of path or data")
+        self.path = path
+        self.data = data
+        self.name = name or (os.path.basename(path) if path else 'resume')
+        self.owned = owned
+        self._mmap = None
+
+    # ---- construction ----
+
+    @classmethod
+    def coerce(cls, source, name=None):
+        """Accept a ResumeSource, path, bytes-like, file-like or Django UploadedFile."""
+        if isinstance(source, ResumeSource):
+            return source
+        if isinstance(source, (str, os.PathLike)):
+            return cls(path=os.fspath(source), name=name)
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return cls(data=source, name=name)
+        if hasattr(source, 'chunks'):
+            return cls.from_upload(source)
+        if hasattr(source, 'read'):
+            if hasattr(source, 'getbuffer'):
+                return cls(data=source.getbuffer(), name=name or getattr(source, 'name', None))
+            return cls(data=source.read(), name=name or getattr(source, 'name', None))
+        raise TypeError(f"Unsupported resume source: {type(source).__name__}")
+
+    @classmethod
+    def from_upload(cls, uploaded_file):
+        """Wrap a Django UploadedFile without copying it to MEDIA_ROOT."""
+        if hasattr(uploaded_file, 'temporary_file_path'):
+            return cls(path=uploaded_file.temporary_file_path(), name=uploaded_file.name)
+        uploaded_file.seek(0)
+        return cls(data=uploaded_file.read(), name=uploaded_file.name)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_mmap'] = None
+        if isinstance(state['data'], memoryview):
+            state['data'] = state['data'].tobytes()
+        return state
+
+    # ---- access ----
+
+    @property
+    def extension(self):
+        _, extension = os.path.splitext(self.name)
+        if extension:
+            return extension.lower()
+        return _sniff_extension(bytes(self.buffer()[:8]))
+
+    @property
+    def size(self):
+        if self.data is not None:
+            return len(self.data)
+        return os.path.getsize(self.path)
+
+    def buffer(self):
+        """The whole resume as a bytes-like object (mmap for path-backed sources)."""
+        if self.data is not None:
+            return self.data
+        if self._mmap is None:
+            with open(self.path, 'rb') as fh:
+                if os.fstat(fh.fileno()).st_size == 0:
+                    return b''
+                self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def open(self):
+        """A fresh seekable binary stream over the resume."""
+        if self.data is not None:
+            return io.BytesIO(self.data)
+        return open(self.path, 'rb')
+
+    def sha256(self):
+        return hashlib.sha256(self.buffer()).hexdigest()
+
+    # ---- lifetime ----
+
+    def detach(self):
+        """
+        Return a source that outlives the request.
+
+        In-memory sources are returned as-is. Django deletes a
+        TemporaryUploadedFile when the request ends, so a path-backed source
+        is hard-linked (or copied, across filesystems) to a private spool file.
+        """
+        if self.data is not None or self.owned:
+            return self
+        spool_dir = os.path.join(tempfile.gettempdir(), 'nexora-resumes')
+        os.makedirs(spool_dir, exist_ok=True)
+        spool_path = os.path.join(spool_dir, f"{get_random_string(16)}{self.extension}")
+        try:
+            os.link(self.path, spool_path)
+        except OSError:
+            shutil.copyfile(self.path, spool_path)
+        return ResumeSource(path=spool_path, name=self.name, owned=True)
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def discard(self):
+        """Release the buffer and delete the spooled copy, if this source owns one."""
+        self.close()
+        if self.owned and self.path and os.path.exists(self.path):
+            os.remove(self.path)
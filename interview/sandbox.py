@@ -0,0 +1,263 @@
+# interview/sandbox.py
+# Resource-limited worker processes for resume parsing.
+#
+# Each worker is a forked child (so it shares the preloaded spaCy model
+# copy-on-write) that runs one parse at a time. A parse gets a wall-clock
+# limit enforced by the parent, a CPU-time limit (RLIMIT_CPU) and an address
+# space cap (RLIMIT_AS) enforced by the kernel. On a breach the worker and
+# everything it started (page pool, pdftoppm, tesseract) is killed as one
+# process group, and the caller gets a ParseSandboxError with a stable code.
+# Workers exit after RESUME_SANDBOX_MAX_JOBS parses so pdfminer caches and
+# heap fragmentation cannot grow without bound.
+#
+# The page pool a parse starts is shut down when the parse ends: its
+# processes inherit the RLIMIT_CPU set for that job, and if they were reused
+# their CPU time would add up across jobs until SIGXCPU killed them.
+
+import atexit
+import logging
+import multiprocessing
+import os
+import queue
+import resource
+import signal
+import threading
+
+from django.conf import settings
+
+from .pdf_extractor import shutdown_page_pool
+
+logger = logging.getLogger(__name__)
+
+
+class ParseSandboxError(Exception):
+    """A sandboxed parse did not produce a result; `code` says why."""
+
+    TIMEOUT = 'parse_timeout'
+    OOM = 'parse_oom'
+    CRASHED = 'parse_crashed'
+    FAILED = 'parse_failed'
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _address_space_bytes():
+    """Current virtual memory size of this process."""
+    with open('/proc/self/statm') as fh:
+        return int(fh.read().split()[0]) * resource.getpagesize()
+
+
+def _worker_main(conn, max_jobs, memory_bytes):
+    """Child loop: receive (func, args, cpu_seconds), reply with a tagged result."""
+    # Own process group, so a kill also takes down pools and OCR subprocesses
+    os.setpgid(0, 0)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    if memory_bytes:
+        # The cap is headroom over what the fork inherited (model, interpreter)
+        limit = _address_space_bytes() + memory_bytes
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    for _ in range(max_jobs):
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        func, args, cpu_seconds = task
+
+        if cpu_seconds:
+            # RLIMIT_CPU counts the whole process lifetime: allow cpu_seconds more.
+            # SIGXCPU at the soft limit terminates the worker.
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            used = int(usage.ru_utime + usage.ru_stime)
+            _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+            resource.setrlimit(resource.RLIMIT_CPU, (used + cpu_seconds, hard))
+
+        try:
+            reply = ('ok', func(*args))
+        except MemoryError:
+            conn.send(('error', ParseSandboxError.OOM, "Resume parsing exceeded its memory limit"))
+            return  # the heap may be in a bad state; let the parent start a fresh worker
+        except Exception as e:
+            reply = ('error', ParseSandboxError.FAILED, str(e))
+        finally:
+            shutdown_page_pool()
+        conn.send(reply)
+
+
+class SandboxWorker:
+    """Parent-side handle for one worker process."""
+
+    def __init__(self, max_jobs, memory_bytes):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_worker_main, args=(child_conn, max_jobs, memory_bytes),
+            name='resume-sandbox',
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs_left = max_jobs
+
+    @property
+    def alive(self):
+        return self.jobs_left > 0 and self.process.is_alive()
+
+    def run(self, func, args, timeout, cpu_seconds):
+        self.jobs_left -= 1
+        try:
+            self.conn.send((func, args, cpu_seconds))
+            ready = self.conn.poll(timeout)
+        except OSError:
+            self.kill()
+            raise ParseSandboxError(ParseSandboxError.CRASHED, "Resume parser worker exited unexpectedly")
+
+        if not ready:
+            self.kill()
+            raise ParseSandboxError(ParseSandboxError.TIMEOUT,
+                                    f"Resume parsing took longer than {timeout} seconds")
+        try:
+            reply = self.conn.recv()
+        except (EOFError, OSError):
+            raise self._death_error()
+
+        if reply[0] == 'ok':
+            return reply[1]
+        _, code, message = reply
+        if code == ParseSandboxError.OOM:
+            self.kill()
+        raise ParseSandboxError(code, message)
+
+    def _death_error(self):
+        """Worker closed the pipe mid-job: classify how it died."""
+        self.process.join(5)
+        exitcode = self.process.exitcode
+        self.kill()
+        if exitcode == -signal.SIGXCPU:
+            return ParseSandboxError(ParseSandboxError.TIMEOUT, "Resume parsing exceeded its CPU time limit")
+        if exitcode == -signal.SIGKILL:
+            # Most likely the kernel OOM killer
+            return ParseSandboxError(ParseSandboxError.OOM, "Resume parser worker was killed (out of memory)")
+        return ParseSandboxError(ParseSandboxError.CRASHED, f"Resume parser worker exited with code {exitcode}")
+
+    def stop(self):
+        """Ask an idle worker to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(2)
+        self.kill()
+
+    def kill(self):
+        self.jobs_left = 0
+        if self.process.is_alive():
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except OSError:
+                self.process.kill()
+        self.process.join(5)
+        self.conn.close()
+
+
+class SandboxPool:
+    """
+    Up to `size` SandboxWorkers, started on demand and reused until recycled.
+
+    run() blocks the calling thread until the parse finishes or is killed;
+    call it from a background thread (see jobs.py).
+    """
+
+    def __init__(self, size, timeout, cpu_seconds, memory_mb, max_jobs):
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_bytes = memory_mb * 1024 * 1024 if memory_mb else 0
+        self.max_jobs = max_jobs
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._workers = set()
+        self.started = 0
+        self.killed = 0
+
+    def _checkout(self):
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if worker.alive:
+                return worker
+            self._retire(worker)
+        worker = SandboxWorker(self.max_jobs, self.memory_bytes)
+        with self._lock:
+            self._workers.add(worker)
+            self.started += 1
+        return worker
+
+    def _retire(self, worker):
+        if worker.process.is_alive():
+            worker.stop()
+        else:
+            worker.kill()
+        with self._lock:
+            self._workers.discard(worker)
+
+    def run(self, func, *args):
+        with self._slots:
+            worker = self._checkout()
+            try:
+                return worker.run(func, args, self.timeout, self.cpu_seconds)
+            except ParseSandboxError as e:
+                if e.code in (ParseSandboxError.TIMEOUT, ParseSandboxError.OOM, ParseSandboxError.CRASHED):
+                    logger.warning(f"Resume sandbox worker {worker.process.pid} stopped: {e.code} ({e})")
+                    with self._lock:
+                        self.killed += 1
+                raise
+            finally:
+                if worker.alive:
+                    self._idle.put(worker)
+                else:
+                    self._retire(worker)
+
+    def shutdown(self):
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.kill()
+
+    def stats(self):
+        with self._lock:
+            return {"workers": len(self._workers), "started": self.started, "killed": self.killed}
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def get_sandbox_pool():
+    """Per-process SandboxPool built from the RESUME_SANDBOX_* settings."""
+    global _pool, _pool_pid
+    if _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool_pid != os.getpid():
+                _pool = SandboxPool(
+                    size=_setting('RESUME_JOB_WORKERS', 2),
+                    timeout=_setting('RESUME_SANDBOX_TIMEOUT', 60),
+                    cpu_seconds=_setting('RESUME_SANDBOX_CPU_SECONDS', 45),
+                    memory_mb=_setting('RESUME_SANDBOX_MEMORY_MB', 1024),
+                    max_jobs=_setting('RESUME_SANDBOX_MAX_JOBS', 50),
+                )
+                _pool_pid = os.getpid()
+                # Runs before multiprocessing joins its children at exit
+                atexit.register(_pool.shutdown)
+    return _pool
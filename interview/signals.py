@@ -0,0 +1,18 @@
+# interview/signals.py
+# Keep process-wide question caches in sync with the Question table.
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Question
+from .question_store import question_store
+
+
+@receiver(post_save, sender=Question)
+def question_saved(sender, instance, **kwargs):
+    question_store.upsert(instance)
+
+
+@receiver(post_delete, sender=Question)
+def question_deleted(sender, instance, **kwargs):
+    question_store.remove(instance.id)
@@ -0,0 +1,200 @@
+# interview/skill_taxonomy.py
+# Compiled skill taxonomy shared by the resume parser.
+#
+# The taxonomy is compiled once per process into a lowercase lookup index and
+# a spaCy PhraseMatcher. A JSON artifact (SKILL_TAXONOMY_PATH) can replace the
+# built-in categories and is hot-swapped when the file changes on disk.
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+SKILL_CATEGORIES = {
+    "Core CS": ["Algorithms", "Big O Notation", "C", "C++", "C#", "F#", "Compiler Design", "Concurrency", "Computer Networks", "Data Structures", "Distributed Systems", "DNS", "Dynamic Programming", "Functional Programming", "Go", "Golang", "Greedy Algorithms", "Graphs", "Hash Tables", "Heaps", "HTTP", "HTTPS", "Java", "JavaScript", "Kernel", "Kotlin", "Linux", "Linked Lists", "Load Balancing", "Memory Management", "Microservices", "Multithreading", "Object-Oriented Programming", "OOP", "Operating Systems", "OS", "Parallelism", "Perl", "PHP", "Processes", "Python", "R", "Recursion", "Ruby", "Rust", "Scala", "Searching", "Shell", "Bash", "Sockets", "Sorting", "SQL", "Swift", "System Design", "TCP/IP", "Threads", "Trees", "Unix", "Virtualization", "Windows", "Actor Model", "Assembly", "A* Search", "B-Tree", "Elixir", "Emacs", "Erlang", "Vim", "Vi", "Design Patterns", "Breadth-First Search", "BFS", "Depth-First Search", "DFS", "Dijkstra's Algorithm", "Trie", "OSI Model", "MATLAB", "File Systems", "Garbage Collection", "RPC", "Remote Procedure Call", "Scheduling", "Semaphores", "Mutex", "Deadlock", "Lisp", "Haskell", "Clojure", "Scheme", "Prolog", "Imperative Programming", "Declarative Programming", "Logic Programming", "Solidity", "Smart Contracts", "Cryptography", "Bit manipulation", "POSIX", "Message Queues", "Queuing Theory", "Finite Automata", "Turing Machine"],
+    "Web Dev": [".NET", ".NET Core", "Angular", "Angular.js", "ASP.NET", "Bootstrap", "Client-Side Rendering", "CSR", "CSS", "Cypress", "Django", "DOM", "ES6", "Express.js", "FastAPI", "Flask", "Gatsby", "GraphQL", "gRPC", "HTML", "JavaScript", "JS", "jQuery", "Jest", "Jinja", "JWT", "JSON Web Token", "Laravel", "LESS", "Material UI", "MUI", "Meteor", "Next.js", "Nginx", "Node.js", "Nuxt.js", "OAuth", "PHP", "Playwright", "PostCSS", "React", "React.js", "React Testing Library", "Redux", "Remix", "REST API", "RESTful APIs", "Ruby on Rails", "Rails", "SASS", "Selenium", "Server-Side Rendering", "SSR", "SolidJS", "Spring", "Spring Boot", "Static Site Generation", "SSG", "Styled-Components", "Svelte", "SvelteKit", "Tailwind", "Tailwind CSS", "TypeScript", "TS", "Vite", "Vitest", "Vue.js", "WebAssembly", "WASM", "WebRTC", "WebSockets", "Webpack", "Accessibility", "a11y", "Apache", "Apache Tomcat", "Tomcat", "Astro", "Babel", "Backbone.js", "CakePHP", "CDN", "CGI", "Chakra UI", "Chrome Extensions", "CodeIgniter", "Cookies", "D3.js", "Ember.js", "EJS", "ESLint", "Fastify", "Handlebars", "Hapi", "Hono", "HTTP/2", "HTTP/3", "IIS", "Koa", "Local Storage", "Session Storage", "Micro-frontends", "Monorepo", "NestJS", "Phoenix", "Polymer", "Preact", "Prettier", "Progressive Web App", "PWA", "Puppeteer", "Qwik", "Serverless Functions", "Service Workers", "Socket.io", "Storybook", "Symfony", "Three.js", "Turborepo", "WebGL", "Wordpress", "Yii"],
+    "AI/ML/DS": ["A/B Testing", "Accuracy", "AI", "Analytics", "ARIMA", "Artificial Intelligence", "BERT", "Business Intelligence", "BI", "CatBoost", "Classification", "Clustering", "CNN", "Computer Vision", "CV", "Convolutional Neural Networks", "Data Cleaning", "Data Mining", "Data Science", "Data Visualization", "Data Wrangling", "Deep Learning", "DL", "EDA", "Exploratory Data Analysis", "F1-score", "Feature Engineering", "GAN", "Generative AI", "GenAI", "Generative Adversarial Networks", "GPT", "Hugging Face", "Hyperparameter Tuning", "Image Segmentation", "JAX", "Jupyter", "Keras", "LangChain", "LightGBM", "LlamaIndex", "Large Language Models", "LLM", "Machine Learning", "ML", "Matplotlib", "Metrics", "MLOps", "Model Evaluation", "Model Training", "Natural Language Processing", "NLP", "Neural Networks", "NN", "NLTK", "NumPy", "Object Detection", "OpenAI", "OpenCV", "Overfitting", "Pandas", "Power BI", "Precision", "PyTorch", "Recall", "Regression", "Reinforcement Learning", "RL", "Retrieval-Augmented Generation", "RAG", "RNN", "Recurrent Neural Networks", "Scikit-learn", "SciPy", "Seaborn", "Sentiment Analysis", "spaCy", "SQL", "Statsmodels", "Supervised Learning", "Tableau", "TensorFlow", "Tokenization", "Transfer Learning", "Transformers", "Underfitting", "Unsupervised Learning", "Vector Database", "XGBoost", "YOLO", "Activation Function", "Adam", "Autoencoder", "AutoML", "Backpropagation", "Bayesian", "Bias-Variance Tradeoff", "BigQuery", "ChromaDB", "Data Augmentation", "Data Governance", "Data Lake", "Data Warehouse", "Decision Trees", "Embeddings", "ETL", "Fine-tuning", "Gradio", "Gradient Descent", "Hidden Markov Model", "HMM", "ImageNet", "K-Means", "KNN", "Kubeflow", "Linear Regression", "Logistic Regression", "Looker", "Loss Function", "LSTM", "MILVUS", "MLflow", "Naive Bayes", "Pinecone", "Plotly", "Qdrant", "Quantization", "Random Forest", "ResNet", "Semi-Supervised Learning", "Streamlit", "Support Vector Machine", "SVM", "t-SNE", "VGG", "Weaviate"],
+    "Cyber Security": ["Access Control", "Application Security", "AppSec", "Attack Vectors", "Authentication", "Authorization", "Blue Team", "Brute Force", "Burp Suite", "CASB", "Cloud Security", "Compliance", "Cryptography", "Cross-Site Scripting", "XSS", "CSPM", "CWPP", "Cybersecurity", "Data Encryption", "Data Loss Prevention", "DLP", "Denial of Service", "DoS", "Distributed Denial of Service", "DDoS", "DevSecOps", "Ethical Hacking", "Firewalls", "GDPR", "Hashcat", "HIPAA", "Identity and Access Management", "IAM", "Incident Response", "IR", "Information Security", "Intrusion Detection System", "IDS", "Intrusion Prevention System", "IPS", "ISO 27001", "John the Ripper", "Malware Analysis", "Man-in-the-Middle", "MITM", "Metasploit", "Multi-Factor Authentication", "MFA", "Nessus", "Network Security", "Nmap", "NIST", "OWASP", "PCI-DSS", "Penetration Testing", "Pen Test", "Phishing", "Purple Team", "Ransomware", "Red Team", "Risk Assessment", "SIEM", "Security Information and Event Management", "Snort", "SOC", "Security Operations Center", "SOC 2", "Social Engineering", "SOAR", "Splunk", "SQL Injection", "Threat Intelligence", "Threat Modeling", "Vulnerability Assessment", "Wireshark", "Zero Trust", "Zero Trust Architecture", "ZTA", "AES", "Antivirus", "BCP", "Business Continuity Planning", "CISSP", "CMMC", "CompTIA Security+", "Security+", "CSA", "CISA", "CEH", "Cross-Site Request Forgery", "CSRF", "Directory Traversal", "Digital Forensics", "DRP", "Disaster Recovery Plan", "EASM", "Endpoint Security", "FedRAMP", "Forensics", "Ghidra", "GVM", "Homomorphic Encryption", "Honeypot", "Insecure Deserialization", "Key Management", "LDAP", "Mobile Security", "Okta", "OpenVAS", "OSINT", "PKI", "Public Key Infrastructure", "Principle of Least Privilege", "Radare2", "Reverse Engineering", "RSA", "SAST", "DAST", "IAST", "Sandboxing", "Security Audits", "Shodan", "SSO", "Single Sign-On", "SSL", "TLS", "TTPs", "WAF", "Web Application Firewall", "XDR", "Zero-Knowledge Proof", "ZKP"],
+    "DB/Cloud/DevOps": ["Agile", "Amazon Web Services", "AWS", "Ansible", "Apache Kafka", "Kafka", "Azure", "Azure DevOps", "Azure Functions", "Bitbucket", "Cassandra", "Chef", "CI/CD", "CircleCI", "Cloud Computing", "CloudFormation", "Configuration Management", "Containerization", "Continuous Deployment", "Continuous Integration", "Datadog", "DB2", "DigitalOcean", "Docker", "DynamoDB", "EC2", "Elasticsearch", "ELK Stack", "Firebase", "Firestore", "GCP", "Google Cloud", "Git", "GitHub", "GitLab", "GitLab CI", "Gitflow", "Google Cloud Functions", "Grafana", "Heroku", "IaC", "Infrastructure as Code", "IAM", "Jenkins", "Jira", "Kanban", "Kubernetes", "K8s", "Lambda", "AWS Lambda", "Linode", "MariaDB", "Microsoft SQL Server", "SQL Server", "MongoDB", "Monitoring", "MySQL", "NoSQL", "Observability", "Oracle", "Oracle SQL", "Packer", "PostgreSQL", "Postgres", "Prometheus", "Pulumi", "Puppet", "RabbitMQ", "RDS", "Redis", "S3", "Scrum", "Serverless", "Site Reliability Engineering", "SRE", "Snowflake", "SQLite", "Terraform", "Travis CI", "Vagrant", "VPC", "Version Control", "Active Directory", "ArgoCD", "AKS", "Azure Kubernetes Service", "BASH Scripting", "ClickHouse", "Cloudflare", "Cloud Run", "CloudWatch", "CockroachDB", "Couchbase", "CouchDB", "DataDog", "Databricks", "EKS", "Elastic Kubernetes Service", "ECS", "FinOps", "Flux", "GKE", "Google Kubernetes Engine", "GitOps", "GitHub Actions", "Helm", "InfluxDB", "Istio", "Linkerd", "Memcached", "New Relic", "Oracle Cloud", "OCI", "PlanetScale", "Powershell", "Rancher", "Redshift", "Route 53", "SaltStack", "Service Mesh", "SLI", "SLO", "Spinnaker", "Supabase", "TeamCity", "Terraform Cloud", "TimescaleDB", "Vault", "HashiCorp Vault", "VMware", "Vercel"],
+    "Mobile Development": ["Mobile Development", "iOS", "Android", "Swift", "SwiftUI", "UIKit", "Objective-C", "ObjC", "Kotlin", "Java", "Android SDK", "Android NDK", "Xcode", "Android Studio", "React Native", "Flutter", "Dart", "Xamarin", ".NET MAUI", "NativeScript", "Ionic", "Capacitor", "Apache Cordova", "Cordova", "PhoneGap", "Core Data", "SQLite", "Realm", "Firebase", "Fastlane", "App Store Connect", "Google Play Console", "TestFlight", "APK", "App Bundle", "AAB", "CocoaPods", "Swift Package Manager", "SPM", "Gradle", "ARKit", "Core ML", "ML Kit", "Jetpack Compose", "Jetpack", "LiveData", "ViewModel", "Room", "RxJava", "RxKotlin", "RxSwift", "Combine", "Grand Central Dispatch", "GCD", "Coroutines", "Kotlin Coroutines", "AlamoFire", "Kingfisher", "Push Notifications", "APNS", "FCM", "WidgetKit", "WatchOS", "TVOS", "Accessibility", "App Clips", "Core Animation", "Core Audio", "Core Graphics", "Core Location", "MapKit", "Metal", "SceneKit", "SpriteKit", "KMM", "Kotlin Multiplatform", "Ktor", "LeakCanary", "ProGuard", "R8", "Android App Bundle", "Material Design", "ConstraintLayout", "Fragments", "Intents", "Services", "Broadcast Receivers", "Content Providers", "Dagger", "Hilt", "Koin", "MVI", "MVVM", "MVC", "VIPER", "Redux", "MobX", "BLoC", "GetX", "Provider", "Riverpod", "SwiftData", "Viper", "Texture", "AsyncDisplayKit", "SnapKit", "Vapor", "Perfect", "Kitura", "Bugsnag", "Sentry", "Crashlytics"],
+    "Game Development": ["Game Development", "Game Dev", "Unreal Engine", "UE4", "UE5", "Unity", "Unity3D", "C#", "C++", "Blueprints", "UnrealScript", "CryEngine", "Godot", "Lumberyard", "GameMaker", "RPG Maker", "Twine", "Blender", "Maya", "3ds Max", "ZBrush", "Autodesk", "Cinema 4D", "Houdini", "Modo", "Substance Painter", "Substance Designer", "Quixel", "Megascans", "HLSL", "GLSL", "Shader", "DirectX", "OpenGL", "Vulkan", "Metal", "WebGL", "Physics Engine", "Havok", "PhysX", "Bullet", "Box2D", "Gameplay Programming", "Game AI", "Level Design", "Game Design", "3D Modeling", "Texturing", "Rigging", "Animation", "Real-Time Rendering", "Ray Tracing", "Game Physics", "Multiplayer", "Networking", "VR", "Virtual Reality", "AR", "Augmented Reality", "Mixed Reality", "MR", "XR", "Steam", "Epic Games Store", "Mobile Games", "Console Development", "2D", "3D", "AAA", "Asset Pipeline", "Artificial Intelligence", "AI", "Asset Store", "Audio Programming", "Cocos2d-x", "Compute Shaders", "DOTS", "ECS", "Entity Component System", "Game Feel", "Juice", "Game Loop", "Game State Management", "Gaffer", "GIMP", "Krita", "Level Editor", "Lighting", "LOD", "Level of Detail", "Materials", "NavMesh", "Pathfinding", "A*", "Particle Systems", "Photon", "PlayFab", "Procedural Generation", "PBR", "Physically Based Rendering", "Pygame", "Render Pipeline", "URP", "HDRP", "Scriptable Objects", "Shaders", "Sprite", "Tilemap", "UI/UX", "User Interface", "Vector Math", "Quaternion", "VFX", "Visual Effects", "Wwise", "FMOD"],
+    "Design/UI/UX": ["UI", "User Interface", "UX", "User Experience", "UI/UX", "Figma", "Sketch", "Adobe XD", "InVision", "Axure", "Balsamiq", "Zeplin", "Framer", "Principle", "Photoshop", "Illustrator", "After Effects", "Adobe Creative Suite", "Interaction Design", "IxD", "User Research", "User Testing", "Usability", "Usability Testing", "Accessibility", "a11y", "WCAG", "Wireframing", "Prototyping", "Mockups", "High-Fidelity", "Hi-Fi", "Low-Fidelity", "Lo-Fi", "Design Systems", "Atomic Design", "User Personas", "Personas", "Journey Mapping", "User Flows", "Empathy Maps", "Heuristic Evaluation", "Card Sorting", "Information Architecture", "IA", "Visual Design", "Typography", "Color Theory", "Responsive Design", "Mobile-First Design", "Human-Computer Interaction", "HCI", "Storyboarding", "A/B Testing", "User-Centered Design", "UCD", "Design Thinking", "Marvel", "Abstract", "User Interviews", "Surveys", "Affinity Diagram", "Canva", "CorelDRAW", "Webflow", "Maze", "UserZoom", "Hotjar"],
+    "Embedded Systems/IoT": ["Embedded Systems", "Embedded C", "Embedded C++", "Internet of Things", "IoT", "M2M", "Machine-to-Machine", "Real-Time Operating System", "RTOS", "FreeRTOS", "Zephyr", "VxWorks", "QNX", "Firmware", "Microcontroller", "MCU", "Microprocessor", "MPU", "SoC", "System-on-a-Chip", "FPGA", "ASIC", "Arduino", "Raspberry Pi", "ESP8266", "ESP32", "STM32", "ARM", "ARM Cortex", "RISC-V", "PIC", "BeagleBone", "Jetson Nano", "MQTT", "CoAP", "AMQP", "SPI", "I2C", "UART", "CAN Bus", "Modbus", "Zigbee", "Z-Wave", "Bluetooth", "BLE", "LoRa", "LoRaWAN", "6LoWPAN", "VHDL", "Verilog", "SystemVerilog", "LabVIEW", "MATLAB", "Simulink", "Keil", "IAR", "Eclipse IoT", "PlatformIO", "Yocto", "Buildroot", "Sensors", "Actuators", "GPIO", "ADC", "DAC", "PWM", "JTAG", "SWD", "OTA", "Over-the-Air", "Edge Computing", "IIoT", "Industrial IoT", "TinyML", "Bare Metal"]
+}
+
+
+class SkillTaxonomy:
+    """
+    Immutable, compiled view of a skill -> category mapping.
+
+    Attributes:
+        categories: category -> tuple of canonical skill names
+        version: content fingerprint (or the version stored in the artifact)
+        index: lowercase skill -> tuple of (category, position, canonical skill)
+        phrases: unique lowercase skill phrases used as matcher patterns
+    """
+
+    def __init__(self, categories, version=None):
+        self.categories = {category: tuple(skills) for category, skills in categories.items()}
+        self.version = version or _fingerprint(self.categories)
+
+        index = {}
+        for category, skills in self.categories.items():
+            for position, skill in enumerate(skills):
+                index.setdefault(skill.lower(), []).append((category, position, skill))
+        self.index = {skill: tuple(entries) for skill, entries in index.items()}
+        self.phrases = tuple(self.index)
+
+        # (vocab, matcher) pair, replaced as a whole so readers never see a half-built matcher
+        self._compiled = None
+        self._compile_lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path):
+        """Load a taxonomy from a JSON artifact written by to_file()."""
+        with open(path, 'r', encoding='utf-8') as fh:
+            data = json.load(fh)
+        return cls(data['categories'], version=data.get('version'))
+
+    def to_file(self, path):
+        """Write the taxonomy as a JSON artifact."""
+        data = {
+            'version': self.version,
+            'categories': {category: list(skills) for category, skills in self.categories.items()},
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as fh:
+            json.dump(data, fh, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def matcher_for(self, nlp):
+        """
+        Return a PhraseMatcher with every skill pattern, compiled once per vocab.
+
+        Patterns are built with the tokenizer only; the rest of the pipeline
+        never runs over the taxonomy.
+        """
+        compiled = self._compiled
+        if compiled is not None and compiled[0] is nlp.vocab:
+            return compiled[1]
+
+        with self._compile_lock:
+            compiled = self._compiled
+            if compiled is None or compiled[0] is not nlp.vocab:
+                from spacy.matcher import PhraseMatcher
+
+                matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+                matcher.add("SKILL_MATCHER", list(nlp.tokenizer.pipe(self.phrases)))
+                compiled = (nlp.vocab, matcher)
+                self._compiled = compiled
+        return compiled[1]
+
+    def categorize(self, skills_list):
+        """
+        Group skills by category using the lowercase index.
+
+        Each category lists its canonical skill names in taxonomy order.
+        """
+        hits = {}
+        for skill in skills_list:
+            for category, position, canonical in self.index.get(skill.lower(), ()):
+                hits.setdefault(category, {})[position] = canonical
+
+        categorized = {}
+        for category in self.categories:
+            matched = hits.get(category)
+            if matched:
+                categorized[category] = [matched[position] for position in sorted(matched)]
+        return categorized
+
+
+def _fingerprint(categories):
+    payload = json.dumps(categories, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(payload).hexdigest()[:12]
+
+
+# ============================================================
+# PROCESS-WIDE TAXONOMY (ATOMIC HOT-SWAP)
+# ============================================================
+
+_taxonomy = None
+_taxonomy_mtime = None
+_last_check = 0.0
+_taxonomy_lock = threading.Lock()
+
+
+def _taxonomy_settings():
+    """Return (artifact path, check interval) from Django settings, if configured."""
+    try:
+        from django.conf import settings
+        return (
+            getattr(settings, 'SKILL_TAXONOMY_PATH', None),
+            getattr(settings, 'SKILL_TAXONOMY_CHECK_INTERVAL', 30),
+        )
+    except Exception:
+        return None, 30
+
+
+def _load(path):
+    if path and os.path.exists(path):
+        return SkillTaxonomy.from_file(path), os.path.getmtime(path)
+    return SkillTaxonomy(SKILL_CATEGORIES), None
+
+
+def get_taxonomy():
+    """
+    Return the current taxonomy, building it on first use.
+
+    When SKILL_TAXONOMY_PATH is set, the artifact is re-checked at most every
+    SKILL_TAXONOMY_CHECK_INTERVAL seconds and swapped in if it changed.
+    """
+    global _taxonomy, _taxonomy_mtime, _last_check
+
+    taxonomy = _taxonomy
+    path, interval = _taxonomy_settings()
+
+    if taxonomy is not None:
+        if not path or time.monotonic() - _last_check < interval:
+            return taxonomy
+
+    with _taxonomy_lock:
+        _last_check = time.monotonic()
+        if _taxonomy is None:
+            _taxonomy, _taxonomy_mtime = _load(path)
+        elif path and os.path.exists(path) and os.path.getmtime(path) != _taxonomy_mtime:
+            try:
+                _taxonomy, _taxonomy_mtime = _load(path)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Could not reload skill taxonomy from {path}: {e}")
+        return _taxonomy
+
+
+def swap_taxonomy(taxonomy, mtime=None):
+    """Atomically replace the process-wide taxonomy and return the previous one."""
+    global _taxonomy, _taxonomy_mtime, _last_check
+
+    with _taxonomy_lock:
+        previous = _taxonomy
+        _taxonomy = taxonomy
+        _taxonomy_mtime = mtime
+        _last_check = time.monotonic()
+    return previous
+
+
+def reload_taxonomy(path=None, nlp=None):
+    """
+    Build a taxonomy from `path` (or the built-in categories) and swap it in.
+
+    If `nlp` is given the matcher is compiled before the swap, so requests
+    never pay for compilation.
+    """
+    if path:
+        taxonomy, mtime = SkillTaxonomy.from_file(path), os.path.getmtime(path)
+    else:
+        taxonomy, mtime = SkillTaxonomy(SKILL_CATEGORIES), None
+    if nlp is not None:
+        taxonomy.matcher_for(nlp)
+    swap_taxonomy(taxonomy, mtime)
+    return taxonomy
@@ -1,3 +1,356 @@
-from django.test import TestCase
+import random
+import re
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.db import connections
+from django.test import SimpleTestCase, override_settings
+
+from . import db_operations, models, pdf_extractor, warmup
+from .answer_evaluation import answer_scorer, keyword_match_score
+from .batch_scoring import BatchScorer
+from .document_extractor import extract_docx_text, extract_plain_text
+from .management.commands import rescore_sessions
+from .ocr import OcrResult
+from .question_index import KeywordIndex, mongo_filter
+from .question_store import QuestionStore
+from .resume_source import ResumeSource
+from .sandbox import SandboxWorker
+
+
+class BatchScorerTests(SimpleTestCase):
+    """BatchScorer must give exactly the numbers keyword_match_score gives."""
+
+    WORDS = [
+        "Python", "python's", "Django,", "SQL", "joins", "REST-API", "node.js", "C++", "C#",
+        "b-tree", "x_y", "__init__", "42", "the", "is", "and", "of", "café", "naïve", "ΟΔΟΣ",
+        "İstanbul", "straße", "a—b", "\t", "\n", "\x00",
+    ]
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.keywords = {
+            qid: [" ".join(rng.choice(self.WORDS) for _ in range(rng.randint(1, 3)))
+                  for _ in range(rng.randint(0, 4))]
+            for qid in range(200)
+        }
+        self.keywords[200] = []                   # no keywords
+        self.keywords[201] = ["the", "is and"]    # stopwords only
+        self.scorer = BatchScorer({
+            qid: answer_scorer.keyword_tokens(keywords) for qid, keywords in self.keywords.items()
+        })
+
+    def assertSameScores(self, answers, question_ids):
+        got = self.scorer.score(answers, question_ids)
+        expected = [keyword_match_score(answer, self.keywords[qid]) for answer, qid in zip(answers, question_ids)]
+        self.assertEqual(list(got), expected)
+
+    def test_random_answers(self):
+        rng = random.Random(11)
+        answers = [
+            "".join(rng.choice(self.WORDS) + rng.choice(["", " ", ",", "-"]) for _ in range(rng.randint(0, 30)))
+            for _ in range(3000)
+        ]
+        question_ids = [rng.choice(list(self.keywords)) for _ in answers]
+        self.assertSameScores(answers, question_ids)
+
+    def test_ascii_only_batch(self):
+        rng = random.Random(13)
+        words = [w for w in self.WORDS if w.isascii() and w != "\x00"]
+        answers = [" ".join(rng.choice(words) for _ in range(rng.randint(0, 20))) for _ in range(1000)]
+        question_ids = [rng.choice(list(self.keywords)) for _ in answers]
+        self.assertSameScores(answers, question_ids)
+
+    def test_edge_cases(self):
+        answers = ["", None, "the is and", "Python python PYTHON", "x\x00y python", "café naïve"]
+        for qid in (0, 200, 201):
+            self.assertSameScores(answers, [qid] * len(answers))
+
+    def test_empty_batch_and_length_mismatch(self):
+        self.assertEqual(len(self.scorer.score([], [])), 0)
+        with self.assertRaises(ValueError):
+            self.scorer.score(["python"], [])
+
+
+def _burn_cpu(seconds):
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+    return seconds
+
+
+def _page_pool_job(seconds):
+    """A sandboxed parse whose CPU time is spent in the page pool."""
+    return pdf_extractor._get_page_pool().submit(_burn_cpu, seconds).result()
+
+
+class _ScannedPdf:
+    """Stand-in for a pdfplumber document whose pages have no text layer."""
+
+    def __init__(self, page_count):
+        self.pages = [SimpleNamespace(extract_text=lambda: "", close=lambda: None) for _ in range(page_count)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class OcrBudgetTests(SimpleTestCase):
+    """The OCR budget covers the whole document, not each page range."""
+
+    def _slow_ocr(self, source, first_page, last_page, time_budget):
+        # Scanned pages that take longer than any budget: OCR runs until it is cut off
+        self.budgets.append(time_budget)
+        time.sleep(max(time_budget, 0))
+        return OcrResult("", [None] * (last_page - first_page + 1), True)
+
+    @override_settings(OCR_TIME_BUDGET=0.3)
+    def test_budget_shared_across_chunks(self):
+        self.budgets = []
+        self.streams = []
+        pdfplumber = SimpleNamespace(open=lambda fh: self.streams.append(fh) or _ScannedPdf(12))
+        pool = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(pool.shutdown)
+
+        with mock.patch.dict("sys.modules", {"pdfplumber": pdfplumber}), \
+                mock.patch.object(pdf_extractor, "_get_page_pool", return_value=pool), \
+                mock.patch.object(pdf_extractor, "ocr_available", return_value=True), \
+                mock.patch.object(pdf_extractor, "ocr_pdf", side_effect=self._slow_ocr), \
+                mock.patch.object(pdf_extractor, "print", create=True):
+            started = time.monotonic()
+            pages = list(pdf_extractor.iter_pdf_pages(b"%PDF", parallel_threshold=2, chunk_pages=4))
+            elapsed = time.monotonic() - started
+
+        self.assertEqual(pages, [""] * 12)
+        self.assertTrue(all(fh.closed for fh in self.streams))
+        self.assertGreaterEqual(len(self.budgets), 1)
+        self.assertLess(elapsed, 0.3 + 0.2)
+
+
+class PreloadTests(SimpleTestCase):
+    """Nothing opened during warm-up may be inherited by forked workers."""
+
+    def test_closes_database_connections(self):
+        connection = connections["default"]
+        self.addCleanup(setattr, connection, "connection", None)
+
+        def open_connection():
+            # What question_store.load() leaves behind in the master
+            connection.connection = mock.MagicMock()
+
+        with mock.patch.object(warmup, "_preloaded", False), \
+                mock.patch.object(warmup, "WARMUP_STEPS", [("question_store", open_connection)]), \
+                mock.patch.object(warmup.gc, "freeze"), \
+                mock.patch.object(warmup.os, "register_at_fork", create=True):
+            timings = warmup.preload()
+
+        self.assertIn("question_store", timings)
+        self.assertTrue(all(conn.connection is None for conn in connections.all()))
+
+
+class RescoreSessionsTests(SimpleTestCase):
+    """Re-scoring keeps answers to changed questions and the session's denominator."""
+
+    def setUp(self):
+        questions = {
+            "What is a join?": (1, ["join", "table"], answer_scorer.keyword_tokens(["join", "table"])),
+        }
+        patcher = mock.patch.object(rescore_sessions, "_questions", questions)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _session(self, **fields):
+        return {
+            "_id": 1, "score": 1.0, "current_level": "beginner", "evaluation_flag": "Harder",
+            "answers": {
+                "What is a join?": {"answer": "a join combines a table with another", "score": 1.0,
+                                    "keywords": ["join", "table"]},
+                "What is a deleted question?": {"answer": "python", "score": 1.0, "keywords": ["python", "flask"]},
+            },
+            **fields,
+        }
+
+    def test_deleted_question_uses_stored_keywords(self):
+        [(_, fields, diff)] = rescore_sessions.rescore_batch([self._session()], 0.5, 0.8)
+
+        self.assertEqual(fields["answers"]["What is a deleted question?"]["score"], 0.5)
+        self.assertEqual(fields["answers"]["What is a join?"]["score"], 1.0)
+        self.assertEqual(fields["score"], 0.75)
+        self.assertEqual(fields["flag_records"]["per_question"]["What is a deleted question?"]["score"], 0.5)
+        self.assertEqual(diff["answer_count"], 2)
+
+    def test_level_wide_per_question_is_not_the_denominator(self):
+        # Older sessions scored the whole level bank into per_question
+        answers = {"What is a join?": {"answer": "join table", "score": 1.0, "keywords": ["join", "table"]}}
+        session = self._session(answers=answers, flag_records={"per_question": {str(i): {} for i in range(60)}})
+        [(_, fields, diff)] = rescore_sessions.rescore_batch([session], 0.5, 0.8)
+
+        self.assertEqual(fields["score"], 1.0)
+        self.assertEqual(fields["evaluation_flag"], "Harder")
+        self.assertFalse(diff["score"])
+
+    def test_keeps_rescored_question_count(self):
+        answers = {"What is a join?": {"answer": "join table", "score": 1.0, "keywords": ["join", "table"]}}
+        session = self._session(answers=answers, flag_records={"question_count": 4})
+        [(_, fields, _)] = rescore_sessions.rescore_batch([session], 0.5, 0.8)
+
+        self.assertEqual(fields["score"], 0.25)
+        self.assertEqual(fields["flag_records"]["question_count"], 4)
+
+
+class QuestionsByIdsTests(SimpleTestCase):
+    """The mongo backend fetches only the requested questions."""
+
+    @override_settings(QUESTION_LOOKUP_BACKEND="mongo")
+    def test_mongo_backend_queries_ids(self):
+        collection = mock.MagicMock()
+        collection.find.return_value = [
+            {"id": 3, "question_text": "Three", "keywords": ["sql"], "level": "beginner"},
+            {"id": 1, "question_text": "One", "keywords": [], "level": "beginner"},
+        ]
+        with mock.patch.object(db_operations, "get_collection", return_value=collection), \
+                mock.patch.object(db_operations.question_store, "load") as load:
+            records = db_operations.get_questions_by_ids([1, 2, 3])
+
+        self.assertEqual([r["id"] for r in records], [1, 3])
+        self.assertEqual(records[1]["keyword_tokens"], frozenset({"sql"}))
+        self.assertEqual(collection.find.call_args[0][0], {"id": {"$in": [1, 2, 3]}})
+        load.assert_not_called()
+
+
+class PlainTextTests(SimpleTestCase):
+    """Truncating a .txt resume must not change how it is decoded."""
+
+    def test_multibyte_character_at_truncation_boundary(self):
+        # target_chars=10 reads 40 bytes, which end in the middle of the first "é"
+        text = "ü" + "x" * 37 + "é" * 20
+        self.assertEqual(extract_plain_text(ResumeSource(data=text.encode("utf-8")), target_chars=10), text[:10])
+
+    def test_bom_and_cp1252(self):
+        text = "résumé " * 10
+        self.assertEqual(extract_plain_text(ResumeSource(data=b"\xef\xbb\xbf" + text.encode("utf-8")),
+                                            target_chars=15), text[:15])
+        self.assertEqual(extract_plain_text(ResumeSource(data=text.encode("cp1252")), target_chars=15),
+                         text[:15])
+        self.assertEqual(extract_plain_text(ResumeSource(data="café".encode("cp1252") * 10), target_chars=5),
+                         "caféc")
+
+
+class SandboxPagePoolTests(SimpleTestCase):
+    """Page pool processes must not carry one job's CPU limit into the next."""
+
+    @override_settings(RESUME_PAGE_WORKERS=1)
+    def test_jobs_in_one_worker(self):
+        worker = SandboxWorker(max_jobs=5, memory_bytes=0)
+        self.addCleanup(worker.kill)
+
+        # Each job stays within its 1s CPU limit, together they do not
+        for _ in range(3):
+            self.assertEqual(worker.run(_page_pool_job, (0.6,), timeout=30, cpu_seconds=1), 0.6)
+
+
+class KeywordIndexTests(SimpleTestCase):
+    """Skills match whole tokens; prefixes only extend to longer phrases."""
+
+    def setUp(self):
+        self.index = KeywordIndex.build([
+            {"id": 1, "keywords": ["JavaScript"]}, {"id": 2, "keywords": ["Java Spring"]},
+            {"id": 3, "keywords": ["SQLite"]}, {"id": 4, "keywords": ["SQL joins"]},
+        ])
+
+    def test_prefix_stops_at_token_boundary(self):
+        self.assertEqual(self.index.match(["java"]), {2})
+        self.assertEqual(self.index.match(["sql"]), {4})
+        self.assertEqual(self.index.match(["javascript", "sqlite"]), {1, 3})
+        self.assertEqual(self.index.match_terms(["java"]), ({"java", "java spring"}, set()))
+
+    def test_mongo_filter_same_rule(self):
+        pattern = mongo_filter(["java"])["$or"][0]["keyword_terms"]["$regex"]
+        self.assertEqual([t for t in ("java", "java spring", "javascript") if re.match(pattern, t)],
+                         ["java", "java spring"])
+
+
+def _question(qid, keywords, level="beginner"):
+    return SimpleNamespace(id=qid, keywords=keywords, keyword_tokens=None, question_text=f"Question {qid}",
+                           level=level, answer="")
+
+
+class QuestionStoreTests(SimpleTestCase):
+    """Saves update the store in place; a stale store is reloaded once."""
+
+    def setUp(self):
+        self.questions = [_question(1, ["python"]), _question(2, ["sql joins"], "intermediate")]
+        patcher = mock.patch.object(models.Question, "objects")
+        patcher.start().all.side_effect = lambda: list(self.questions)
+        self.addCleanup(patcher.stop)
+        self.store = QuestionStore()
+        self.store.load()
+
+    def test_upsert_and_remove_in_place(self):
+        records, version = self.store._records, self.store.version
+        self.store.upsert(_question(3, ["sql"]))
+        self.store.upsert(_question(1, ["django"]))
+        self.store.remove(2)
+
+        self.assertIs(self.store._records, records)
+        self.assertEqual(self.store.version, version + 3)
+        self.assertEqual(self.store.rank(["sql"], 10), [3])
+        self.assertEqual(self.store.rank(["django"], 10), [1])
+        self.assertEqual(self.store.level_ids("beginner"), (1, 3))
+        self.assertEqual([r["id"] for r in self.store.get_many([3, 2, 1])], [3, 1])
+
+    @override_settings(QUESTION_STORE_TTL=0)
+    def test_stale_store_reloads_once(self):
+        loads = []
+        load = self.store.load
+
+        def slow_load():
+            loads.append(threading.get_ident())
+            time.sleep(0.2)
+            return load()
+
+        start = threading.Barrier(8)
+
+        def read():
+            start.wait()
+            self.store.get(1)
+
+        with mock.patch.object(self.store, "load", side_effect=slow_load):
+            threads = [threading.Thread(target=read) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(loads), 1)
+
+
+class DocxTextTests(SimpleTestCase):
+    """Tab and break elements become text only inside runs."""
+
+    def _docx(self, body):
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("word/document.xml", (
+                '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                f"<w:body>{body}</w:body></w:document>"
+            ))
+        return ResumeSource(data=buffer.getvalue())
+
+    def test_tab_stop_definitions_are_not_text(self):
+        source = self._docx(
+            '<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/><w:tab w:val="right" w:pos="9000"/>'
+            "</w:tabs></w:pPr><w:r><w:t>Python</w:t><w:tab/><w:t>5 years</w:t><w:br/><w:t>Django</w:t></w:r></w:p>"
+        )
+        streams = []
+        open_stream = source.open
+        with mock.patch.object(source, "open", side_effect=lambda: streams.append(open_stream()) or streams[-1]):
+            self.assertEqual(extract_docx_text(source), "Python\t5 years\nDjango")
+        self.assertTrue(streams and all(fh.closed for fh in streams))
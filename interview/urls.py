@@ -6,9 +6,11 @@ from . import views
 urlpatterns = [
   
     path('upload/', views.upload_resume, name='upload_resume'),
+    path('upload/status/<str:job_id>/', views.resume_job_status, name='resume_job_status'),
     path('dashboard/', views.dashboard, name='interview_dashboard'),
     path('start/', views.start_interview_view, name='start_interview'),
     path('question/', views.interview_question_view, name='interview_question'),
+    path('metrics/', views.metrics_view, name='interview_metrics'),
 
     # Results page with string session_id
     path('results/<str:session_id>/', views.results_view, name='interview_results'),
@@ -2,13 +2,15 @@
 # Utility functions for interview management
 
 from .answer_evaluation import (
-    evaluate_user_level,
+    answer_scorer,
+    summarize_scores,
     build_flag_record,
     next_level_from_flag,
     keyword_match_score
 )
 from .db_operations import get_questions_by_skills, save_answers, get_session_data
-from .models import Question
+from .question_sampler import sample_interview_questions
+from .question_store import question_store
 
 
 # ============================================================
@@ -22,6 +24,10 @@ def get_fixed_interview_questions(skills):
        - 3 intermediate
        - 3 hard
 
+    Questions are drawn at random from those matching the skills (see
+    question_sampler.py); levels that are short are backfilled from the
+    other matches, then from the whole bank.
+
     Args:
         skills (list): Extracted skills from resume
 
@@ -33,45 +39,7 @@ def get_fixed_interview_questions(skills):
     if not skills or not isinstance(skills, list):
         skills = []
 
-    # Fetch questions by skills (large pool)
-    all_questions = get_questions_by_skills(skills, limit=200)
-
-    # If no skill-based questions found, use all questions
-    if not all_questions:
-        all_questions = [
-            {
-                "keywords": q.keywords if q.keywords else [],
-                "question_text": q.question_text,
-                "level": q.level,
-                "answer": q.answer,
-            }
-            for q in Question.objects.all()
-        ]
-
-    # Split by difficulty
-    beginner = [q for q in all_questions if q.get("level") == "beginner"]
-    intermediate = [q for q in all_questions if q.get("level") == "intermediate"]
-    hard = [q for q in all_questions if q.get("level") == "hard"]
-
-    # Helper to pick N questions
-    def pick(question_list, n):
-        if len(question_list) >= n:
-            return question_list[:n]
-        return question_list
-
-    selected = []
-
-    # Pick fixed difficulty counts
-    selected.extend(pick(beginner, 4))
-    selected.extend(pick(intermediate, 3))
-    selected.extend(pick(hard, 3))
-
-    # If less than 10, fill from remaining pool
-    if len(selected) < 10:
-        remaining = [q for q in all_questions if q not in selected]
-        selected.extend(remaining[:(10 - len(selected))])
-
-    return selected[:10]
+    return sample_interview_questions(skills)
 
 
 # ============================================================
@@ -96,31 +64,43 @@ def score_single_answer(answer_text, expected_keywords):
 # ADAPTIVE SYSTEM (OLD) - NOW USED ONLY FOR EVALUATION
 # ============================================================
 
-def evaluate_interview_answers(user_id, field, current_level, user_answers):
+def evaluate_interview_answers(user_id, field, current_level, user_answers, questions):
     """
     Evaluate user's answers and determine next difficulty level.
 
+    Only the questions served in the interview are scored, against the
+    keyword tokens of the same cached records they were rendered from, so
+    completion runs no query and does not grow with the bank.
+
     Args:
         user_id: User identifier
         field: Question category
         current_level: beginner/intermediate/hard
         user_answers: Dict -> question_id : answer_text
+        questions: The served question records (from the question store)
 
     Returns:
         dict: evaluation and scoring summary
     """
+    answers = {str(qid): text for qid, text in user_answers.items()}
+    scores = {
+        str(q["id"]): answer_scorer.score(answers.get(str(q["id"]), ""), q["keyword_tokens"])
+        for q in questions
+    }
+    return evaluate_interview_scores(user_id, field, current_level, scores)
 
-    # Fetch expected questions for this level
-    questions = Question.objects.filter(level=current_level)
 
-    # Build mapping: question_id -> expected_keywords
-    level_bank = {str(q.id): q.keywords for q in questions}
+def evaluate_interview_scores(user_id, field, current_level, scores):
+    """
+    Same as evaluate_interview_answers, for answers already scored when
+    they were submitted.
 
-    # Perform scoring
-    per_question, avg_score, overall_flag = evaluate_user_level(
-        user_answers, 
-        level_bank
-    )
+    Args:
+        scores: Dict -> question_id (str) : score, for every served question
+    """
+
+    # Flags and averages
+    per_question, avg_score, overall_flag = summarize_scores(scores)
 
     # Determine next difficulty
     next_level = next_level_from_flag(current_level, overall_flag)
@@ -162,15 +142,7 @@ def get_adaptive_questions(skills, current_level='beginner', limit=5):
     all_questions = get_questions_by_skills(skills, limit=100) if skills else []
 
     if not all_questions:
-        all_questions = [
-            {
-                "keywords": q.keywords if q.keywords else [],
-                "question_text": q.question_text,
-                "level": q.level,
-                "answer": q.answer,
-            }
-            for q in Question.objects.all()
-        ]
+        all_questions = question_store.all()
 
     level_questions = [
         q for q in all_questions 
@@ -1,13 +1,21 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from .models import Resume, Question, InterviewSession, Profile
-from .resume_parser import extract_text_from_resume, extract_skills
-from .db_operations import insert_resume, get_questions_by_skills, save_answers, get_session_data
-from .utils import get_adaptive_questions, calculate_interview_score, score_single_answer
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
+from django.urls import reverse
+from .models import Resume, Profile
+from .jobs import submit_resume_job, get_job_status
+from .admission import get_resume_admission, AdmissionRejected
+from .resume_cache import store_original, resume_cache
+from .sandbox import get_sandbox_pool
+from .resume_source import ResumeSource
+from .question_sampler import candidate_pools
+from .db_operations import insert_parsed_resume, get_session_data
+from .db_operations import record_interview_answer, get_interview_answers, get_questions_by_ids
+from .utils import calculate_interview_score
 from .utils import get_fixed_interview_questions
-from .answer_evaluation import keyword_match_score
-import random
+from .answer_evaluation import answer_scorer, flag_for_score
 
 # NOTE: Views updated to use new models and utilities
 # Includes integration with answerflagging.py and mongo_conn.py
@@ -26,47 +34,55 @@ def upload_resume(request):
         if not resume_file:
             return render(request, 'interview/upload_resume.html', {'error': 'No file selected.'})
 
-        # Parse the resume
+        # Parse from memory (small uploads) or an mmap of Django's temp file (large
+        # ones); an identical file parsed before is a cache hit
         try:
-            import os
             from django.conf import settings
-            
-            # Save file temporarily
-            temp_path = os.path.join(settings.MEDIA_ROOT, 'resumes', resume_file.name)
-            os.makedirs(os.path.dirname(temp_path), exist_ok=True)
-            
-            with open(temp_path, 'wb+') as destination:
-                for chunk in resume_file.chunks():
-                    destination.write(chunk)
-            
-            # Extract text from resume
-            extracted_text = extract_text_from_resume(temp_path)
-            
-            # Extract skills
-            extracted_skills = extract_skills(extracted_text)
-            
-            # Prepare resume data
-            resume_data = {
-                'username': request.user.username,
-                'email': request.user.email or '',
-                'phone': '',  # TODO: Extract from resume
-                'skills': extracted_skills,
-                'experience': extracted_text[:1000],  # First 1000 chars
-                'education': '',  # TODO: Extract from resume
-            }
-            
-            # Insert resume using mongo_conn utility
-            result = insert_resume(resume_data)
-            
-            # Show success message to user
-            if result.get('message'):
+
+            source = ResumeSource.from_upload(resume_file)
+            digest = source.sha256()
+            if getattr(settings, 'RESUME_STORE_ORIGINALS', False):
+                store_original(source, digest)
+
+            cached = resume_cache.get(digest)
+            if cached is not None:
+                source.close()
+                result = insert_parsed_resume(request.user.username, request.user.email or '', cached)
                 messages.success(request, result['message'])
-            else:
-                messages.success(request, f"Resume uploaded successfully! Extracted {len(extracted_skills)} skills.")
+                return redirect('interview_dashboard')
+        except Exception as e:
+            print(f"Could not read resume: {e}")
+            return render(request, 'interview/upload_resume.html', {'error': f'Error processing resume: {str(e)}'})
+
+        # Admission control: parsing is CPU-heavy, so shed load when saturated
+        try:
+            ticket = get_resume_admission().acquire()
+        except AdmissionRejected as e:
+            response = render(request, 'interview/upload_resume.html', {
+                'error': "We're processing a lot of resumes right now. Please try again in a moment."
+            }, status=503)
+            response['Retry-After'] = str(e.retry_after)
+            return response
+
+        # Parse the resume
+        try:
+            # Parse in the background; the dashboard polls the job status
+            job = submit_resume_job(request.user.username, request.user.email or '', digest, source,
+                                    on_finish=ticket.release)
+            request.session['resume_job_id'] = job.job_id
+            
+            if request.headers.get('x-requested-with') == 'XMLHttpRequest':
+                return JsonResponse({
+                    'job_id': job.job_id,
+                    'status': job.status,
+                    'status_url': reverse('resume_job_status', args=[job.job_id]),
+                }, status=202)
             
+            messages.info(request, "Resume uploaded! We're extracting your skills now.")
             return redirect('interview_dashboard')
             
         except Exception as e:
+            ticket.release()
             print(f"Could not parse resume or skills: {e}")
             import traceback
             traceback.print_exc()
@@ -75,25 +91,60 @@ def upload_resume(request):
     return render(request, 'interview/upload_resume.html')
 
 
+# resume job status (polled by the dashboard)
+@login_required(login_url='/login/')
+def resume_job_status(request, job_id):
+    status = get_job_status(job_id, request.user.username)
+    if status is None:
+        return JsonResponse({'error': 'Job not found'}, status=404)
+    return JsonResponse(status)
+
+
+# runtime counters (staff only)
+@staff_member_required
+def metrics_view(request):
+    return JsonResponse({
+        'resume_admission': get_resume_admission().stats(),
+        'resume_cache': resume_cache.stats(),
+        'resume_sandbox': get_sandbox_pool().stats(),
+        'question_pools': candidate_pools.stats(),
+    })
+
+
 # dashboard view
 @login_required(login_url='/login/')
 def dashboard(request):
+    # A resume still being parsed in the background, if any
+    job_id = request.session.get('resume_job_id')
+    resume_job = get_job_status(job_id, request.user.username) if job_id else None
+    if resume_job and resume_job['status'] in ('done', 'failed'):
+        del request.session['resume_job_id']
+        if resume_job['status'] == 'done':
+            messages.success(request, f"Resume processed! Extracted {len(resume_job['skills'])} skills.")
+        else:
+            messages.error(request, f"Could not process your resume: {resume_job['error']}")
+        resume_job = None
+
     try:
         # Get the user's profile
         profile = Profile.objects.get(user=request.user)
-        
-        # Get the latest resume
-        latest_resume = Resume.objects.filter(username=request.user.username).order_by('-uploaded_at').first()
-        
-        context = {
-            'profile': profile,
-            'resume': latest_resume,
-            'skills': latest_resume.skills if latest_resume else []
-        }
-        return render(request, 'interview/dashboard.html', context)
     except Profile.DoesNotExist:
         # If they don't have a profile, send them to the upload page
-        return redirect('upload_resume')
+        # (unless their first resume is still being processed)
+        if not resume_job:
+            return redirect('upload_resume')
+        profile = None
+        
+    # Get the latest resume
+    latest_resume = Resume.objects.filter(username=request.user.username).order_by('-uploaded_at').first()
+    
+    context = {
+        'profile': profile,
+        'resume': latest_resume,
+        'skills': latest_resume.skills if latest_resume else [],
+        'resume_job': resume_job,
+    }
+    return render(request, 'interview/dashboard.html', context)
     
 # start interview view
 @login_required(login_url='/login/')
@@ -118,111 +169,123 @@ def start_interview_view(request):
     current_level = profile.current_level if hasattr(profile, 'current_level') else 'beginner'
     
     # --- 3. Get adaptive questions based on skills AND level ---
+    # (short levels are backfilled from the whole bank, so this is only
+    # empty when there are no questions at all)
     questions = get_fixed_interview_questions(skills)
 
-
-    # If no questions found, try without level filtering
-    if not questions:
-        all_questions = Question.objects.all()[:10]
-        questions = [
-            {
-                "keywords": q.keywords if q.keywords else [],
-                "question_text": q.question_text,
-                "level": q.level,
-                "answer": q.answer,
-            }
-            for q in all_questions
-        ]
-    
     if not questions:
         # No questions in database at all
         return render(request, 'interview/dashboard.html', {
             'error': 'No questions available. Please contact administrator.'
         })
 
-    # --- 4. Store in session (including current level) ---
-    request.session['interview_questions'] = questions
-    request.session['current_question_index'] = 0
-    request.session['user_answers'] = {}
-    request.session['interview_level'] = current_level
+    # --- 4. Store in session: only ids and position ---
+    # Question content comes from the question store and answers go to
+    # InterviewAnswer rows, so each step writes a few bytes of session.
+    from django.utils.crypto import get_random_string
+
+    request.session['interview'] = {
+        'id': get_random_string(12),
+        'question_ids': [q['id'] for q in questions],
+        'index': 0,
+        'level': current_level,
+    }
 
     # --- 5. Redirect to the first question page ---
     return redirect('interview_question')
 
+def _served_questions(question_ids):
+    """Records of questions in the running interview by id (a deleted one has no text or keywords)."""
+    found = {q['id']: q for q in get_questions_by_ids(question_ids)}
+    return {
+        qid: found.get(qid) or {
+            "id": qid, "keywords": [], "keyword_tokens": frozenset(),
+            "question_text": "", "level": None, "answer": None,
+        }
+        for qid in question_ids
+    }
+
+
+def _served_question(question_id):
+    return _served_questions([question_id])[question_id]
+
+
 @login_required(login_url='/login/')
 def interview_question_view(request):
     # Get interview data from the user's session
-    questions = request.session.get('interview_questions', [])
-    current_index = request.session.get('current_question_index', 0)
-    user_answers = request.session.get('user_answers', {})
-    interview_level = request.session.get('interview_level', 'beginner')
+    interview = request.session.get('interview')
 
     # If any data is missing, the interview hasn't started
-    if not questions or current_index >= len(questions):
+    if not interview or interview['index'] >= len(interview['question_ids']):
         return redirect('interview_dashboard')
 
+    question_ids = interview['question_ids']
+    current_index = interview['index']
+    interview_level = interview['level']
+
     # --- Handle Answer Submission ---
     if request.method == 'POST':
         answer_text = request.POST.get('answer', '')
-        question = questions[current_index]
+        question_id = question_ids[current_index]
+
+        # Score the answer now, so finishing only has to finalize
+        score = answer_scorer.score(answer_text, _served_question(question_id)['keyword_tokens'])
 
-        # Save the answer in session
-        user_answers[question['question_text']] = answer_text
-        request.session['user_answers'] = user_answers
+        # Append the scored answer to the interview's progress record
+        record_interview_answer(
+            interview['id'], request.user.username, current_index, question_id, answer_text,
+            score=score, flag=flag_for_score(score),
+        )
 
         # Move to the next question
         next_index = current_index + 1
-        request.session['current_question_index'] = next_index
+        interview['index'] = next_index
+        request.session['interview'] = interview
 
         # Check if the interview is over
-        if next_index >= len(questions):
+        if next_index >= len(question_ids):
             # End interview - save to database
             latest_resume = Resume.objects.filter(username=request.user.username).order_by('-uploaded_at').first()
             profile = Profile.objects.get(user=request.user)
+            submitted = get_interview_answers(interview['id'])
+            served = _served_questions(question_ids)
             
-            # Calculate scores using answerflagging
-            total_score = 0
+            # Collect the scores given on submit (unanswered questions score 0)
+            scores = {}
             scored_answers = {}
             
-            for q_text, ans_text in user_answers.items():
-                # Find the question to get keywords
-                question_data = next((q for q in questions if q['question_text'] == q_text), None)
-                if question_data:
-                    keywords = question_data.get('keywords', [])
-                    # Score the answer
-                    score = keyword_match_score(ans_text, keywords)
-                    total_score += score
-                    scored_answers[q_text] = {
-                        'answer': ans_text,
-                        'score': round(score, 2),
-                        'keywords': keywords
+            for position, qid in enumerate(question_ids):
+                entry = submitted.get(position)
+                scores[str(qid)] = entry['score'] if entry else 0.0
+                if entry:
+                    question_data = served[qid]
+                    scored_answers[question_data['question_text']] = {
+                        'answer': entry['answer'],
+                        'score': round(entry['score'], 2),
+                        'keywords': question_data.get('keywords', [])
                     }
             
-            avg_score = total_score / len(questions) if questions else 0
-            
-            # Use evaluate_interview_answers for full evaluation (import at top if needed)
-            from .utils import evaluate_interview_answers
+            avg_score = sum(scores.values()) / len(question_ids)
             
-            # Prepare user_answers_for_eval mapping question_id to answer text
-            user_answers_for_eval = {q_text: ans_text for q_text, ans_text in user_answers.items()}
+            # Use evaluate_interview_scores for full evaluation (import at top if needed)
+            from .utils import evaluate_interview_scores
             
             # Get evaluation results
             eval_results = None
             try:
-                eval_results = evaluate_interview_answers(
+                eval_results = evaluate_interview_scores(
                     user_id=profile.unique_user_id,
                     field='general',  # You can extract from skills
                     current_level=interview_level,
-                    user_answers=user_answers_for_eval
+                    scores=scores
                 )
             except Exception as e:
                 print(f"Evaluation error: {e}")
             
             # Save answers using db_operations utility with enhanced data
             from .models import InterviewSession as InterviewSessionModel
-            from django.utils.crypto import get_random_string
             
-            session_id = get_random_string(12)
+            session_id = interview['id']
             
             # Create interview session with level tracking
             interview_session = InterviewSessionModel(
@@ -247,11 +310,7 @@ def interview_question_view(request):
             messages.success(request, f"Interview completed! Your score: {round(avg_score * 100, 1)}%")
             
             # Clear session
-            del request.session['interview_questions']
-            del request.session['current_question_index']
-            del request.session['user_answers']
-            if 'interview_level' in request.session:
-                del request.session['interview_level']
+            del request.session['interview']
             
             return redirect('interview_results', session_id=session_id)
         else:
@@ -259,12 +318,12 @@ def interview_question_view(request):
             return redirect('interview_question')
 
     # --- Show the Current Question (GET Request) ---
-    current_question = questions[current_index]
+    current_question = _served_question(question_ids[current_index])
 
     context = {
         'question': {'text': current_question.get('question_text', '')},
         'question_number': current_index + 1,
-        'total_questions': len(questions),
+        'total_questions': len(question_ids),
         'current_level': interview_level
     }
     return render(request, 'interview/question_page.html', context)
@@ -0,0 +1,116 @@
+# interview/warmup.py
+# Pre-fork warm-up: load shared, read-only state once in the master process.
+#
+# Run from InterviewConfig.ready() when INTERVIEW_PRELOAD is on. Under a
+# pre-forking server started with --preload (e.g. `gunicorn --preload
+# nexora.wsgi`), forked workers inherit the loaded spaCy model, the compiled
+# skill matcher and the question store as copy-on-write pages. gc.freeze()
+# keeps the garbage collector from touching (and therefore copying) them.
+# Database connections opened while warming are closed before the fork, so
+# workers never share the master's sockets.
+
+import gc
+import logging
+import os
+import time
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_preloaded = False
+
+
+def _warm_nlp():
+    from .providers import get_nlp
+    get_nlp()
+
+
+def _warm_skill_matcher():
+    from .providers import get_nlp
+    from .skill_taxonomy import get_taxonomy
+    get_taxonomy().matcher_for(get_nlp())
+
+
+def _warm_questions():
+    from .question_store import question_store
+    question_store.load()
+
+
+WARMUP_STEPS = [
+    ("spacy_model", _warm_nlp),
+    ("skill_matcher", _warm_skill_matcher),
+    ("question_store", _warm_questions),
+]
+
+
+def memory_usage():
+    """
+    Return memory stats for this process in kB.
+
+    rss is always present; pss / shared are filled from /proc on Linux and
+    show how much of the RSS is actually shared with the master.
+    """
+    stats = {}
+    try:
+        with open("/proc/self/smaps_rollup") as fh:
+            for line in fh:
+                key, _, value = line.partition(":")
+                if key in ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Dirty"):
+                    stats[key.lower()] = int(value.split()[0])
+        stats["shared"] = stats.pop("shared_clean", 0) + stats.pop("shared_dirty", 0)
+    except OSError:
+        import resource
+        stats["rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return stats
+
+
+def _format_memory(stats):
+    return ", ".join(f"{key}={value / 1024:.1f}MB" for key, value in stats.items())
+
+
+def _report_worker_memory():
+    logger.info(f"Worker {os.getpid()} forked: {_format_memory(memory_usage())}")
+
+
+def preload():
+    """
+    Load every shared structure once, then freeze the heap.
+
+    Failures in one step are logged and do not stop the others; whatever is
+    not preloaded will simply be loaded lazily on first use in each worker.
+    Returns a dict of per-step timings in seconds.
+    """
+    global _preloaded
+    if _preloaded:
+        return {}
+
+    before = memory_usage()
+    timings = {}
+    for name, step in WARMUP_STEPS:
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            logger.warning(f"Warm-up step '{name}' failed: {e}")
+            continue
+        timings[name] = round(time.perf_counter() - started, 3)
+
+    # Each worker opens its own connection on first query
+    connections.close_all()
+
+    # Move everything allocated so far out of the collector's reach so that
+    # collections in the workers don't write to (and un-share) these pages.
+    gc.collect()
+    gc.freeze()
+
+    after = memory_usage()
+    logger.info(f"Warm-up finished in pid {os.getpid()}: {timings}")
+    logger.info(f"Memory before warm-up: {_format_memory(before)}")
+    logger.info(f"Memory after warm-up:  {_format_memory(after)}")
+
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=_report_worker_memory)
+
+    _preloaded = True
+    return timings
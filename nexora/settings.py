@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -134,4 +135,109 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Media files (for user uploads like resumes)
 MEDIA_URL = '/media/'
-MEDIA_ROOT = BASE_DIR / 'media'
\ No newline at end of file
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# Skill taxonomy used by the resume parser.
+# Point SKILL_TAXONOMY_PATH at a JSON artifact (see `manage.py export_skill_taxonomy`)
+# to override the built-in categories; workers pick up changes to the file
+# within SKILL_TAXONOMY_CHECK_INTERVAL seconds without a restart.
+SKILL_TAXONOMY_PATH = None
+SKILL_TAXONOMY_CHECK_INTERVAL = 30
+
+# spaCy model for resume parsing. Loaded lazily on first parse; install it with
+# `python -m spacy download en_core_web_sm` (it is never downloaded at runtime).
+SPACY_MODEL = 'en_core_web_sm'
+
+# Warm-up (see interview/warmup.py): load the spaCy model, skill matcher and
+# question store in InterviewConfig.ready() and gc.freeze() them so pre-forked
+# workers share the pages. wsgi.py turns this on for web servers only.
+INTERVIEW_PRELOAD = os.environ.get('NEXORA_PRELOAD', '0') == '1'
+
+# Seconds a worker keeps its cached copy of the question bank before
+# reloading it (saves/deletes in the same worker apply immediately).
+QUESTION_STORE_TTL = 300
+
+# Where skill -> question lookups run: "memory" uses the question store's
+# inverted keyword index; "mongo" runs an indexed query with a projection
+# (needs migration 0006's indexes), so nothing is cached per worker.
+QUESTION_LOOKUP_BACKEND = 'memory'
+
+# Interview questions are sampled at random from the top quota * this many
+# most relevant matches of each level (memory backend only). 1 always serves
+# the best matches; larger values trade relevance for variety.
+QUESTION_RANK_POOL = 3
+
+# Per-worker memo of those candidate pools, keyed by the normalized skill set
+# and level (interview/question_sampler.py): at most QUESTION_POOL_CACHE_SIZE
+# entries, each kept QUESTION_POOL_CACHE_TTL seconds or until the bank changes.
+QUESTION_POOL_CACHE_SIZE = 1024
+QUESTION_POOL_CACHE_TTL = 600
+
+# Background resume processing (interview/jobs.py): number of parser
+# processes per web worker. Uploads return immediately and are parsed here.
+RESUME_JOB_WORKERS = 2
+
+# Sandbox limits for each parse (interview/sandbox.py). A parse is killed
+# after RESUME_SANDBOX_TIMEOUT wall-clock seconds or RESUME_SANDBOX_CPU_SECONDS
+# of CPU time (job error "parse_timeout"), or when its worker grows more than
+# RESUME_SANDBOX_MEMORY_MB past its size at fork ("parse_oom"). Workers are
+# replaced after RESUME_SANDBOX_MAX_JOBS parses. Keep the timeout above
+# OCR_TIME_BUDGET so scanned resumes return partial text instead of failing.
+RESUME_SANDBOX_TIMEOUT = 60
+RESUME_SANDBOX_CPU_SECONDS = 45
+RESUME_SANDBOX_MEMORY_MB = 1024
+RESUME_SANDBOX_MAX_JOBS = 50
+
+# Admission control for resume parsing (per web worker). Uploads beyond
+# MAX_IN_FLIGHT wait up to QUEUE_TIMEOUT seconds in a queue of MAX_QUEUE;
+# anything else gets 503 with Retry-After. Counters: /interview/metrics/.
+RESUME_PARSE_MAX_IN_FLIGHT = 4
+RESUME_PARSE_MAX_QUEUE = 8
+RESUME_PARSE_QUEUE_TIMEOUT = 2.0
+RESUME_PARSE_RETRY_AFTER = 30
+
+# PDF extraction limits (interview/pdf_extractor.py). Only the first
+# RESUME_MAX_PAGES pages are read, larger files are rejected, and extraction
+# stops once RESUME_TEXT_TARGET_CHARS characters have been collected. PDFs
+# longer than RESUME_PARALLEL_PAGE_THRESHOLD pages are extracted in chunks of
+# RESUME_PAGE_CHUNK pages across RESUME_PAGE_WORKERS processes.
+RESUME_MAX_PAGES = 30
+RESUME_MAX_BYTES = 10 * 1024 * 1024
+RESUME_TEXT_TARGET_CHARS = 50000
+RESUME_PARALLEL_PAGE_THRESHOLD = 8
+RESUME_PAGE_CHUNK = 4
+RESUME_PAGE_WORKERS = 4
+
+# .docx resumes are streamed out of word/document.xml; documents whose XML
+# expands past RESUME_DOCX_MAX_XML_BYTES are rejected (zip bomb guard).
+RESUME_DOCX_MAX_XML_BYTES = 50 * 1024 * 1024
+
+# OCR for scanned pages (interview/ocr.py): pages are rasterized one at a
+# time at OCR_DPI, OCR_WORKERS pages at once, and a document gets at most
+# OCR_TIME_BUDGET seconds (partial text is kept when the budget runs out).
+OCR_DPI = 200
+OCR_WORKERS = 2
+OCR_TIME_BUDGET = 30
+
+# Caches. 'resume_parse' holds parse results keyed by the uploaded file's
+# SHA-256 (interview/resume_cache.py); when MAX_ENTRIES is reached,
+# 1/CULL_FREQUENCY of the entries are evicted.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'resume_parse': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache' / 'resume_parse',
+        'TIMEOUT': 60 * 60 * 24 * 30,
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+            'CULL_FREQUENCY': 4,
+        },
+    },
+}
+
+# Keep a copy of every uploaded resume in MEDIA_ROOT/resumes/<sha256><ext>.
+# Parsing never needs it: uploads are parsed from memory (or an mmap of
+# Django's temp file for large ones).
+RESUME_STORE_ORIGINALS = False
@@ -13,4 +13,9 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'nexora.settings')
 
+# Preload shared NLP / question data in InterviewConfig.ready(). Start the
+# server with preloading (e.g. `gunicorn --preload nexora.wsgi`) so this runs
+# once in the master and forked workers share the memory copy-on-write.
+os.environ.setdefault('NEXORA_PRELOAD', '1')
+
 application = get_wsgi_application()